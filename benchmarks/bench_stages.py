@@ -0,0 +1,219 @@
+import os
+import sys
+import json
+import math
+import time
+import tempfile
+import argparse
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from iitm_scraper.waits import WaitEngine
+from iitm_scraper.extraction import expand_question_rows, snapshot_questions, questions_from_snapshot
+from iitm_scraper.fill_plan import plan_question, apply_plan
+from iitm_scraper.solver import AnswerLineParser
+from benchmarks.fixtures import synthetic_page, write_fixtures
+from benchmarks.fake_webdriver import FakeWebDriver
+
+# --- Stage benchmarks ---
+# Measures Step 14 scraping, answer parsing and PART 3 filling, plus a
+# re-fill of the filled page (which should cost one snapshot and nothing
+# else), against synthetic pages (10/50/200 gcb-question-row items by
+# default) or recorded portal HTML, through the fake WebDriver or headless
+# Chrome on file:// pages.
+# Reports per-stage wall time p50/p95 and WebDriver commands per run.
+#
+#   python benchmarks/bench_stages.py --sizes 10 50 200 --runs 20
+#   python benchmarks/bench_stages.py --html page.html --driver chrome
+
+
+def percentile(values, pct):
+    # Nearest-rank percentile
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def count_commands(driver):
+    # Counts every chromedriver command on a real driver; WebElement calls also
+    # go through the parent driver's execute()
+    commands = Counter()
+    execute = driver.execute
+
+    def counted(command, params=None):
+        commands[command] += 1
+        return execute(command, params)
+
+    driver.execute = counted
+    return commands
+
+
+def run_scrape(driver, wait_engine):
+    # Mirrors scrape_questions() with artifact capture on: scroll, one settle,
+    # one page_source, bulk expand + snapshot, de-duplication and classification
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    wait_engine.settle("scrape:scroll_bottom", network=True)
+    driver.page_source
+    expand_question_rows(driver)
+    wait_engine.dom_quiet("scrape:expand_rows")
+    snapshot = snapshot_questions(driver)
+    return questions_from_snapshot(snapshot)
+
+
+def run_parse(questions, answers, chunk_size=40):
+    # Streams a model-style reply through the incremental answer parser
+    reply = "".join(f"{q['number']}) {answers.get(q['number'], 'A')}\n" for q in questions)
+    parser = AnswerLineParser(questions)
+    for start in range(0, len(reply), chunk_size):
+        parser.feed(reply[start:start + chunk_size])
+    parser.close()
+    return parser.answers
+
+
+def run_fill(driver, questions, answers):
+    # Mirrors fill_answers(): one fresh snapshot, plan every answer, one bulk apply
+    rows = {f"Q{row['index']}": row for row in snapshot_questions(driver)}
+    kinds = {q["number"]: q["kind"] for q in questions}
+    actions = []
+    for number, answer in answers.items():
+        if number in rows:
+            actions.extend(plan_question(number, rows[number], kinds.get(number), answer)["actions"])
+    return apply_plan(driver, actions)
+
+
+class FakeTarget:
+    def __init__(self, html, rtt):
+        self.html = html
+        self.driver = FakeWebDriver(html, rtt=rtt)
+
+    def reload(self):
+        self.driver.load(self.html)
+
+    @property
+    def commands(self):
+        return self.driver.commands
+
+    def reset_counts(self):
+        self.driver.reset_counts()
+
+    def close(self):
+        pass
+
+
+class ChromeTarget:
+    def __init__(self, path):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        self.url = "file://" + os.path.abspath(path)
+        self.driver = webdriver.Chrome(options=options)
+        self._commands = count_commands(self.driver)
+        self.reload()
+
+    def reload(self):
+        self.driver.get(self.url)
+
+    @property
+    def commands(self):
+        return self._commands
+
+    def reset_counts(self):
+        self._commands.clear()
+
+    def close(self):
+        self.driver.quit()
+
+
+def bench_case(label, target, answers, runs):
+    wait_engine = WaitEngine(target.driver)
+    results = {"scrape": [], "parse": [], "fill": [], "refill": []}
+    commands = {"scrape": 0, "parse": 0, "fill": 0, "refill": 0}
+    questions = []
+    for _ in range(runs):
+        target.reload()
+
+        target.reset_counts()
+        started = time.perf_counter()
+        questions = run_scrape(target.driver, wait_engine)
+        results["scrape"].append(time.perf_counter() - started)
+        commands["scrape"] = sum(target.commands.values())
+
+        started = time.perf_counter()
+        parsed = run_parse(questions, answers)
+        results["parse"].append(time.perf_counter() - started)
+
+        target.reset_counts()
+        started = time.perf_counter()
+        run_fill(target.driver, questions, parsed)
+        results["fill"].append(time.perf_counter() - started)
+        commands["fill"] = sum(target.commands.values())
+
+        # Re-run on the now filled page: reconciliation should find nothing to apply
+        target.reset_counts()
+        started = time.perf_counter()
+        run_fill(target.driver, questions, parsed)
+        results["refill"].append(time.perf_counter() - started)
+        commands["refill"] = sum(target.commands.values())
+
+    report = {"case": label, "questions": len(questions), "runs": runs, "stages": {}}
+    for stage, samples in results.items():
+        report["stages"][stage] = {
+            "p50_ms": round(percentile(samples, 50) * 1000, 3),
+            "p95_ms": round(percentile(samples, 95) * 1000, 3),
+            "commands": commands[stage],
+        }
+    return report
+
+
+def print_report(reports):
+    print(f"{'case':<28}{'questions':>10}  {'stage':<8}{'p50 ms':>10}{'p95 ms':>10}{'commands':>10}")
+    for report in reports:
+        for stage, stats in report["stages"].items():
+            print(f"{report['case']:<28}{report['questions']:>10}  {stage:<8}"
+                  f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['commands']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrape, parse and fill stages.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10, 50, 200],
+                        help="synthetic page sizes in question rows (default: 10 50 200)")
+    parser.add_argument("--html", nargs="*", default=[], help="recorded portal pages to replay as well")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--driver", choices=["fake", "chrome"], default="fake")
+    parser.add_argument("--rtt-ms", type=float, default=0.0,
+                        help="simulated per-command round trip for the fake driver")
+    parser.add_argument("--json", help="also write the report to this JSON file")
+    args = parser.parse_args()
+
+    cases = []
+    fixture_dir = tempfile.mkdtemp(prefix="aas-bench-")
+    paths = write_fixtures(fixture_dir, args.sizes)
+    for size in args.sizes:
+        html, answers, _ = synthetic_page(size)
+        cases.append((f"synthetic-{size}", paths[size], html, answers))
+    for path in args.html:
+        with open(path, "r", encoding="utf-8") as f:
+            cases.append((os.path.basename(path), path, f.read(), {}))
+
+    reports = []
+    for label, path, html, answers in cases:
+        target = ChromeTarget(path) if args.driver == "chrome" else FakeTarget(html, args.rtt_ms / 1000)
+        try:
+            reports.append(bench_case(label, target, answers, args.runs))
+        finally:
+            target.close()
+
+    print_report(reports)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+        print(f"📊 Report saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_stages import percentile
+from benchmarks.fixtures import write_fixtures
+
+# --- Startup benchmark ---
+# Times fresh interpreter runs of the commands that should never touch the
+# browser stack (help, offline parse, cache inspection) and checks that none
+# of them imports Selenium, webdriver-manager, psutil or the Gemini SDK.
+# Exits non-zero when a p95 exceeds the budget or a heavy module leaks in,
+# so it can guard startup time in CI.
+#
+#   python benchmarks/bench_startup.py --runs 10 --budget-ms 1000
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["selenium", "webdriver_manager", "psutil", "google.generativeai"]
+
+# Runs main() in-process and reports which heavy modules ended up loaded
+LEAK_CHECK = """
+import sys, json
+from iitm_scraper.cli import main
+main(sys.argv[1:])
+print("HEAVY=" + json.dumps([name for name in %r if name in sys.modules]))
+""" % HEAVY_MODULES
+
+
+def commands(page_path, workdir):
+    return {
+        "import": [sys.executable, "-c", "import iitm_scraper.cli"],
+        "help": [sys.executable, "-m", "iitm_scraper", "--help"],
+        "parse-only": [sys.executable, "-m", "iitm_scraper", "--from-html", page_path, "--parse-only"],
+        "cache-stats": [sys.executable, "-m", "iitm_scraper.answer_cache",
+                        "--path", os.path.join(workdir, "cache.sqlite3"), "stats"],
+    }
+
+
+def run_env(workdir):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env["ARTIFACTS_DIR"] = os.path.join(workdir, "artifacts")
+    env["LOG_PATH"] = os.path.join(workdir, "scraper.log")
+    env["RUN_REPORT_PATH"] = os.path.join(workdir, "run_report.json")
+    return env
+
+
+def time_command(argv, env, cwd, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(argv, env=env, cwd=cwd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def heavy_modules_loaded(page_path, env, cwd):
+    result = subprocess.run([sys.executable, "-c", LEAK_CHECK, "--from-html", page_path, "--parse-only"],
+                            env=env, cwd=cwd, check=True, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith("HEAVY="):
+            return json.loads(line[len("HEAVY="):])
+    raise RuntimeError("leak check produced no result")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time for browser-free commands.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="fail if any command's p95 exceeds this")
+    parser.add_argument("--json", help="also write the report to this JSON file")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="aas-startup-")
+    page_path = write_fixtures(workdir, [50])[50]
+    env = run_env(workdir)
+
+    report = {"budget_ms": args.budget_ms, "commands": {}}
+    print(f"{'command':<14}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, argv in commands(page_path, workdir).items():
+        samples = time_command(argv, env, workdir, args.runs)
+        stats = {"p50_ms": round(percentile(samples, 50) * 1000, 1), "p95_ms": round(percentile(samples, 95) * 1000, 1)}
+        report["commands"][name] = stats
+        print(f"{name:<14}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}")
+
+    report["heavy_modules_loaded"] = heavy_modules_loaded(page_path, env, workdir)
+    print(f"Heavy modules loaded by --from-html --parse-only: {report['heavy_modules_loaded'] or 'none'}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"📊 Report saved to {args.json}")
+
+    slow = [name for name, stats in report["commands"].items() if stats["p95_ms"] > args.budget_ms]
+    if slow or report["heavy_modules_loaded"]:
+        print(f"❌ Startup budget exceeded: slow={slow}, heavy={report['heavy_modules_loaded']}")
+        sys.exit(1)
+    print(f"✅ All commands within {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import json
+import time
+from collections import Counter
+from lxml import html as lxml_html
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from iitm_scraper import waits
+from iitm_scraper import extraction
+from iitm_scraper import fill_plan
+from iitm_scraper.offline_parser import snapshot_from_html, INPUT_XPATH
+
+# --- Fake WebDriver ---
+# Replays a recorded or synthetic page held in an lxml tree and answers the
+# WebDriver commands the scrape and fill stages issue. The repo's injected
+# scripts are emulated in Python (snapshot via offline_parser, the bulk
+# apply plan against the tree); any other script is treated as a side-effect
+# such as a scroll and returns None. Every command is counted, and an
+# optional per-command delay models the chromedriver round trip.
+
+
+class FakeElement:
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    def click(self):
+        self._driver._command("click")
+        node = self._node
+        if node.tag == "input" and (node.get("type") or "").lower() in ("radio", "checkbox"):
+            self._driver._toggle(node)
+        elif node.tag == "option":
+            self._driver._select_option(node)
+
+    @property
+    def text(self):
+        self._driver._command("text")
+        from iitm_scraper.offline_parser import inner_text
+        return inner_text(self._node)
+
+    def get_attribute(self, name):
+        self._driver._command("get_attribute")
+        if name == "outerHTML":
+            return lxml_html.tostring(self._node, encoding="unicode", with_tail=False)
+        if name == "checked":
+            return "true" if self._node.get("checked") is not None else None
+        return self._node.get(name)
+
+    def clear(self):
+        self._driver._command("clear")
+        self._node.set("value", "")
+
+    def send_keys(self, value):
+        self._driver._command("send_keys")
+        if self._node.tag == "textarea":
+            self._node.text = (self._node.text or "") + value
+        else:
+            self._node.set("value", (self._node.get("value") or "") + value)
+
+    def find_element(self, by, value):
+        found = self.find_elements(by, value, command="find_element")
+        if not found:
+            raise NoSuchElementException(value)
+        return found[0]
+
+    def find_elements(self, by, value, command="find_elements"):
+        self._driver._command(command)
+        return self._driver._query(self._node, by, value)
+
+
+class FakeWebDriver:
+    def __init__(self, html, rtt=0.0, url="file:///practice_assignment.html"):
+        self.rtt = rtt
+        self.commands = Counter()
+        self.current_url = url
+        self.window_handles = ["main"]
+        self.load(html)
+
+    def load(self, html):
+        self.tree = lxml_html.fromstring(html)
+
+    def reset_counts(self):
+        self.commands = Counter()
+
+    def _command(self, name):
+        self.commands[name] += 1
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def _query(self, node, by, value):
+        if by != By.XPATH:
+            raise NotImplementedError(f"FakeWebDriver only supports XPath locators, got {by}")
+        return [FakeElement(self, found) for found in node.xpath(value)]
+
+    def _toggle(self, node):
+        if (node.get("type") or "").lower() == "radio":
+            name = node.get("name")
+            for other in self.tree.xpath("//input[@type='radio'][@name=$name]", name=name or ""):
+                other.attrib.pop("checked", None)
+            node.set("checked", "checked")
+        elif node.get("checked") is not None:
+            node.attrib.pop("checked")
+        else:
+            node.set("checked", "checked")
+
+    def _select_option(self, option):
+        for sibling in option.getparent().xpath("./option"):
+            sibling.attrib.pop("selected", None)
+        option.set("selected", "selected")
+
+    @property
+    def page_source(self):
+        self._command("page_source")
+        return lxml_html.tostring(self.tree, encoding="unicode")
+
+    def find_elements(self, by, value):
+        self._command("find_elements")
+        return self._query(self.tree, by, value)
+
+    def find_element(self, by, value):
+        self._command("find_element")
+        found = self._query(self.tree, by, value)
+        if not found:
+            raise NoSuchElementException(value)
+        return found[0]
+
+    def set_script_timeout(self, seconds):
+        self._command("set_script_timeout")
+
+    def execute_async_script(self, script, *args):
+        self._command("execute_async_script")
+        if script == waits.SETTLE_JS:
+            return {"settled": True, "dom_quiet": True, "stable": True, "network_idle": True}
+        raise NotImplementedError("FakeWebDriver cannot run this async script")
+
+    def execute_script(self, script, *args):
+        self._command("execute_script")
+        if script == extraction.EXPAND_ROWS_JS:
+            return len(self.tree.xpath("//div[contains(@class, 'gcb-question-row')]"))
+        if script == extraction.SNAPSHOT_JS:
+            return json.dumps(snapshot_from_html(lxml_html.tostring(self.tree, encoding="unicode")))
+        if script == fill_plan.APPLY_JS:
+            return json.dumps(self._apply(json.loads(args[0])))
+        return None
+
+    def _apply(self, actions):
+        rows = self.tree.xpath("//div[contains(@class, 'gcb-question-row')]")
+        report = {}
+        for action in actions:
+            entry = report.setdefault(action["number"], {"applied": 0, "errors": []})
+            try:
+                node = rows[action["row"] - 1].xpath(INPUT_XPATH)[action["input"]]
+                if action["op"] == "set_text":
+                    if node.tag == "textarea":
+                        node.text = action["value"]
+                    else:
+                        node.set("value", action["value"])
+                elif action["op"] in ("check", "uncheck"):
+                    if (node.get("checked") is not None) != (action["op"] == "check"):
+                        self._toggle(node)
+                elif action["op"] == "select":
+                    self._select_option(node.xpath(".//option")[action["value"]])
+                else:
+                    raise ValueError(f"unknown op {action['op']}")
+                entry["applied"] += 1
+            except (IndexError, ValueError) as e:
+                entry["errors"].append(str(e))
+        return report
+
+    def quit(self):
+        self._command("quit")
@@ -0,0 +1,88 @@
+import os
+
+# --- Synthetic practice pages ---
+# Builds gcb-question-row pages of any size, cycling through the five
+# question layouts the portal uses, plus the answers that fit them, so each
+# stage can be measured at 10/50/200 questions.
+
+LAYOUTS = ["single-choice", "multi-choice", "text", "dropdown-matching", "radio-grid-matching"]
+LETTERS = ["A", "B", "C", "D"]
+
+
+def _single_choice(i):
+    inputs = "".join(
+        f'<input type="radio" name="q{i}" id="q{i}-{k}" value="{label}"><label for="q{i}-{k}">{label}</label>'
+        for k, label in enumerate(["True", "False"])
+    )
+    return f"State whether statement {i} about shell globbing is true.", inputs, "True"
+
+
+def _multi_choice(i):
+    inputs = "".join(
+        f'<input type="checkbox" name="q{i}" id="q{i}-{k}"><label for="q{i}-{k}">option {i}.{k}</label>'
+        for k in range(4)
+    )
+    return f"Select every command that prints the working directory ({i}).", inputs, f"option {i}.1, option {i}.3"
+
+
+def _text(i):
+    return f"How many lines does sample file {i} contain?", '<input type="text" name="q{0}">'.format(i), str(i * 7)
+
+
+def _dropdown_matching(i):
+    options = '<option value=""></option>' + "".join(f'<option value="{x}">{x}</option>' for x in LETTERS)
+    inputs = "".join(f'<div>Item {k}: <select name="q{i}-{k}">{options}</select></div>' for k in range(1, 5))
+    return f"Match each command with its description ({i}).", inputs, "1-B, 2-C, 3-A, 4-D"
+
+
+def _radio_grid_matching(i):
+    rows = []
+    for k in range(1, 5):
+        cells = "".join(
+            f'<td><input type="radio" name="q{i}-{k}" id="q{i}-{k}-{x}" value="{x}"><label for="q{i}-{k}-{x}">{x}</label></td>'
+            for x in LETTERS
+        )
+        rows.append(f"<tr><td>Row {k}</td>{cells}</tr>")
+    return f"Match each signal with its default action ({i}).", f"<table>{''.join(rows)}</table>", "1-D, 2-A, 3-C, 4-B"
+
+
+BUILDERS = {
+    "single-choice": _single_choice,
+    "multi-choice": _multi_choice,
+    "text": _text,
+    "dropdown-matching": _dropdown_matching,
+    "radio-grid-matching": _radio_grid_matching,
+}
+
+
+def synthetic_page(num_questions):
+    # Returns (html, {question number: answer}, {question number: layout})
+    rows, answers, layouts = [], {}, {}
+    for i in range(1, num_questions + 1):
+        layout = LAYOUTS[(i - 1) % len(LAYOUTS)]
+        prompt, inputs, answer = BUILDERS[layout](i)
+        rows.append(
+            f'<div class="gcb-question-row" id="row-{i}">'
+            f'<div class="qt-embedded"><div class="qt-question"><p>Q{i}. {prompt}</p></div>'
+            f'<div class="qt-choices">{inputs}</div></div></div>'
+        )
+        answers[f"Q{i}"] = answer
+        layouts[f"Q{i}"] = layout
+    html = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Practice Assignment</title></head>"
+        f"<body><div class='gcb-assessment'>{''.join(rows)}</div>"
+        "<button type='button'>Check Answers</button></body></html>"
+    )
+    return html, answers, layouts
+
+
+def write_fixtures(directory, sizes):
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for size in sizes:
+        html, _, _ = synthetic_page(size)
+        path = os.path.join(directory, f"practice_{size}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(html)
+        paths[size] = path
+    return paths
@@ -0,0 +1,19 @@
+# IITM practice assignment scraper: scrape, solve and fill a week's practice
+# assignment. Run it with "python -m iitm_scraper"; the entry point is
+# iitm_scraper.cli.main. Submodules are imported on demand so that importing
+# the package stays cheap.
+#
+# Every module reads its settings from the environment when it is imported,
+# so the .env file is loaded here, before any of them: the working
+# directory's .env first, then the project root's for anything still unset.
+# This covers the helper CLIs (python -m iitm_scraper.<module>) as well.
+
+
+def _load_env():
+    import os
+    from dotenv import find_dotenv, load_dotenv
+    load_dotenv(find_dotenv(usecwd=True))
+    load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"))
+
+
+_load_env()
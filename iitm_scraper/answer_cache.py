@@ -0,0 +1,179 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import argparse
+import unicodedata
+
+# --- Persistent answer cache ---
+# SQLite store of generated answers keyed by a hash of the normalized
+# question text, the model name and the prompt version, so re-running an
+# already-solved week needs no Gemini calls. Entries expire after a TTL and
+# the table is trimmed to a maximum size by least-recent use.
+
+CACHE_PATH = os.getenv("ANSWER_CACHE_PATH", "answer_cache.sqlite3")
+CACHE_TTL_DAYS = float(os.getenv("ANSWER_CACHE_TTL_DAYS", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "5000"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def normalize_question(text):
+    text = unicodedata.normalize("NFKC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def cache_key(question, model, prompt_version):
+    payload = "\x1f".join([model, str(prompt_version), normalize_question(question)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, path=CACHE_PATH, ttl_days=CACHE_TTL_DAYS, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400 if ttl_days and ttl_days > 0 else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _bump(self, name, amount=1):
+        self.conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def get(self, question, model, prompt_version):
+        key = cache_key(question, model, prompt_version)
+        now = time.time()
+        row = self.conn.execute("SELECT answer, created_at FROM answers WHERE key = ?", (key,)).fetchone()
+        if row and self._expired(row[1], now):
+            self.conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+            row = None
+        with self.conn:
+            if row is None:
+                self.misses += 1
+                self._bump("misses")
+                return None
+            self.hits += 1
+            self._bump("hits")
+            self.conn.execute("UPDATE answers SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        return row[0]
+
+    def put(self, question, model, prompt_version, answer):
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO answers "
+                "(key, model, prompt_version, question, answer, created_at, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (cache_key(question, model, prompt_version), model, str(prompt_version),
+                 normalize_question(question), answer, now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        if self.ttl_seconds is not None:
+            self.conn.execute("DELETE FROM answers WHERE created_at < ?", (now - self.ttl_seconds,))
+        if self.max_entries and self.max_entries > 0:
+            self.conn.execute(
+                "DELETE FROM answers WHERE key IN ("
+                "SELECT key FROM answers ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def purge(self, expired_only=False, model=None, older_than_days=None):
+        clauses, params = [], []
+        if expired_only:
+            if self.ttl_seconds is None:
+                return 0
+            clauses.append("created_at < ?")
+            params.append(time.time() - self.ttl_seconds)
+        if model:
+            clauses.append("model = ?")
+            params.append(model)
+        if older_than_days is not None:
+            clauses.append("last_used < ?")
+            params.append(time.time() - older_than_days * 86400)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.conn:
+            return self.conn.execute(f"DELETE FROM answers{where}", params).rowcount
+
+    def stats(self):
+        counters = dict(self.conn.execute("SELECT name, value FROM counters").fetchall())
+        entries = self.conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "session_hits": self.hits,
+            "session_misses": self.misses,
+        }
+
+    def entries(self, limit=20):
+        return self.conn.execute(
+            "SELECT key, model, prompt_version, question, answer, created_at, last_used, hits "
+            "FROM answers ORDER BY last_used DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or purge the persistent Gemini answer cache.")
+    parser.add_argument("--path", default=CACHE_PATH, help=f"cache database (default: {CACHE_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="show entry count and hit/miss counters")
+    list_cmd = commands.add_parser("list", help="show the most recently used entries")
+    list_cmd.add_argument("--limit", type=int, default=20)
+    purge_cmd = commands.add_parser("purge", help="delete entries (all of them unless filtered)")
+    purge_cmd.add_argument("--expired", action="store_true", help="only entries past the TTL")
+    purge_cmd.add_argument("--model", help="only entries generated by this model")
+    purge_cmd.add_argument("--older-than-days", type=float, help="only entries unused for this many days")
+    args = parser.parse_args()
+
+    cache = AnswerCache(args.path)
+    try:
+        if args.command == "stats":
+            for name, value in cache.stats().items():
+                print(f"{name}: {value}")
+        elif args.command == "list":
+            for key, model, version, question, answer, created_at, last_used, hits in cache.entries(args.limit):
+                used = time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used))
+                print(f"{key[:12]}  {model} v{version}  hits={hits}  last_used={used}")
+                print(f"    Q: {question[:100]}")
+                print(f"    A: {answer}")
+        elif args.command == "purge":
+            removed = cache.purge(args.expired, args.model, args.older_than_days)
+            print(f"🧹 Removed {removed} cached answers")
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import logging
+import argparse
+import threading
+
+# --- Artifact store ---
+# Stage outputs (page source, question DOM, questions, answers) are kept in
+# memory and handed straight to the next stage. When persistence is on, each
+# artifact is also written once as a gzip file named by the SHA-256 of its
+# content, so identical snapshots across steps or runs share one object.
+# A small manifest per run maps artifact names to their hashes.
+#
+#   artifacts/objects/3f/3fa4...e1.gz
+#   artifacts/runs/20250301-101500-ns_25t1_se2001-w4.json
+#
+#   python -m iitm_scraper.artifacts runs
+#   python -m iitm_scraper.artifacts show latest page_source > page.html
+
+ARTIFACTS_DIR = os.getenv("ARTIFACTS_DIR", "artifacts")
+ARTIFACTS_PERSIST = os.getenv("ARTIFACTS_PERSIST", "1").lower() in ("1", "true", "yes")
+COMPRESS_LEVEL = 6
+
+
+def _to_bytes(data):
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+class ArtifactStore:
+    def __init__(self, root=ARTIFACTS_DIR, run_id=None, persist=ARTIFACTS_PERSIST, **meta):
+        self.root = root
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        self.persist = persist
+        self.meta = meta
+        self.items = {}
+        self.manifest = {}
+        self._lock = threading.Lock()
+
+    def object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.gz")
+
+    def manifest_path(self, run_id=None):
+        return os.path.join(self.root, "runs", f"{run_id or self.run_id}.json")
+
+    def put(self, name, data):
+        # Keeps the artifact in memory and, when persisting, stores it by content hash
+        with self._lock:
+            self.items[name] = data
+        if not self.persist:
+            return None
+        raw = _to_bytes(data)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self.object_path(digest)
+        stored = not os.path.exists(path)
+        if stored:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=COMPRESS_LEVEL) as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+        with self._lock:
+            self.manifest[name] = {
+                "sha256": digest,
+                "bytes": len(raw),
+                "stored_bytes": os.path.getsize(path),
+                "deduplicated": not stored,
+                "at": round(time.time(), 3),
+            }
+            self._write_manifest()
+        logging.info(f"Artifact '{name}' -> {digest[:12]} ({len(raw)} bytes{', already stored' if not stored else ''})")
+        return digest
+
+    def get(self, name, default=None):
+        return self.items.get(name, default)
+
+    def _write_manifest(self):
+        path = self.manifest_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"run_id": self.run_id, "meta": self.meta, "artifacts": self.manifest}, f, indent=2)
+
+    def load_object(self, digest):
+        with gzip.open(self.object_path(digest), "rb") as f:
+            return f.read()
+
+    def runs(self):
+        runs_dir = os.path.join(self.root, "runs")
+        if not os.path.isdir(runs_dir):
+            return []
+        # Oldest first, by when each manifest was last written
+        paths = [os.path.join(runs_dir, name) for name in os.listdir(runs_dir) if name.endswith(".json")]
+        manifests = []
+        for path in sorted(paths, key=os.path.getmtime):
+            with open(path, "r", encoding="utf-8") as f:
+                manifests.append(json.load(f))
+        return manifests
+
+    def load(self, run_id, name):
+        # run_id may be "latest": the most recent run that persisted this artifact
+        candidates = self.runs() if run_id == "latest" else [
+            manifest for manifest in self.runs() if manifest["run_id"] == run_id
+        ]
+        for manifest in reversed(candidates):
+            entry = manifest["artifacts"].get(name)
+            if entry:
+                return self.load_object(entry["sha256"])
+        raise KeyError(f"No artifact '{name}' for run '{run_id}'")
+
+
+_active = ArtifactStore(persist=False)
+# Per-thread override, so concurrent jobs (tab pool) keep their artifacts apart
+_local = threading.local()
+
+
+def start_run(run_id=None, **meta):
+    # The new store becomes the process default and the calling thread's store
+    global _active
+    _active = ArtifactStore(run_id=run_id, **meta)
+    bind(_active)
+    return _active
+
+
+def bind(store):
+    # Routes this thread's artifacts to store (a job's solver thread binds its job's store)
+    _local.store = store
+
+
+def active():
+    return getattr(_local, "store", None) or _active
+
+
+def put(name, data):
+    return active().put(name, data)
+
+
+def get(name, default=None):
+    return active().get(name, default)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect persisted run artifacts.")
+    parser.add_argument("--root", default=ARTIFACTS_DIR, help=f"artifact directory (default: {ARTIFACTS_DIR})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("runs", help="list runs and the artifacts they stored")
+    show_cmd = commands.add_parser("show", help="print an artifact to stdout")
+    show_cmd.add_argument("run", help="run id, or 'latest'")
+    show_cmd.add_argument("name", help="artifact name, e.g. page_source, question_dom, questions, answers")
+    export_cmd = commands.add_parser("export", help="write an artifact to a plain file")
+    export_cmd.add_argument("run", help="run id, or 'latest'")
+    export_cmd.add_argument("name")
+    export_cmd.add_argument("path")
+    args = parser.parse_args()
+
+    store = ArtifactStore(root=args.root, persist=False)
+    if args.command == "runs":
+        for manifest in store.runs():
+            print(f"{manifest['run_id']}  {manifest.get('meta', {})}")
+            for name, entry in manifest["artifacts"].items():
+                print(f"    {name:<14} {entry['sha256'][:12]}  {entry['bytes']:>9} bytes -> {entry['stored_bytes']:>8} stored"
+                      f"{'  (dedup)' if entry.get('deduplicated') else ''}")
+    elif args.command == "show":
+        print(store.load(args.run, args.name).decode("utf-8"))
+    elif args.command == "export":
+        with open(args.path, "wb") as f:
+            f.write(store.load(args.run, args.name))
+        print(f"📦 Exported {args.name} from run {args.run} to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,782 @@
+import os
+import time
+import queue
+import contextlib
+import logging
+import subprocess
+import urllib.request
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from . import artifacts
+from . import checkpoints
+from . import driver_resolver
+from . import locators
+from . import logging_setup
+from . import run_report
+from .waits import WaitEngine
+from .route_cache import RouteCache, ROUTE_CACHE_ENABLED
+from .fill_plan import plan_question, apply_plan
+from .extraction import INPUT_QUERY, expand_question_rows, snapshot_questions, questions_from_snapshot, row_texts
+from .command_trace import CommandTracer
+from .pipeline import save_questions, start_solver, MISSING_ANSWER
+from .run_report import span, timed
+
+# --- Live browser run ---
+# Chrome setup, portal navigation, scraping, filling and submission. Only
+# imported for live runs, so offline and cache commands never load Selenium.
+
+PORTAL_URL = "https://app.onlinedegree.iitm.ac.in"
+QUESTION_ROW_XPATH = "//div[contains(@class, 'gcb-question-row')]"
+
+# --- Warm browser ---
+# By default the run attaches to a Chrome already listening on the debugging
+# port and leaves it running afterwards. Chrome is only launched (detached,
+# so it outlives this process) when nothing is listening, and the old
+# kill-and-relaunch path is the fallback or --fresh-browser.
+CHROME_DEBUG_ADDRESS = os.getenv("CHROME_DEBUG_ADDRESS", "127.0.0.1:9222")
+CHROME_ATTACH = os.getenv("CHROME_ATTACH", "1").lower() in ("1", "true", "yes")
+CHROME_LAUNCH_TIMEOUT = float(os.getenv("CHROME_LAUNCH_TIMEOUT", "15"))
+# How long a cached Practice Assignment link gets to show question rows
+DEEP_LINK_TIMEOUT = float(os.getenv("DEEP_LINK_TIMEOUT", "10"))
+
+# --- Step 2: Close existing Chrome processes ---
+def close_chrome_processes():
+    import psutil
+    for proc in psutil.process_iter(['pid', 'name']):
+        try:
+            if proc.info['name'].lower() == 'chrome.exe':
+                proc.kill()
+                logging.info(f"Closed Chrome process (PID: {proc.info['pid']})")
+                print(f"🔴 Closed Chrome process (PID: {proc.info['pid']})")
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+    time.sleep(2)
+
+# --- Step 3: Set up Chrome options ---
+def chrome_arguments():
+    chrome_user_data_dir = os.getenv("CHROME_USER_DATA_DIR", os.path.expanduser("~/AppData/Local/Google/Chrome/User Data"))
+    return [
+        f"--user-data-dir={chrome_user_data_dir}",
+        "--profile-directory=Profile 2",
+        "--start-maximized",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--disable-extensions",
+        "--log-level=0",
+        f"--remote-debugging-port={CHROME_DEBUG_ADDRESS.rsplit(':', 1)[-1]}",
+    ]
+
+def build_chrome_options():
+    chrome_options = Options()
+    for argument in chrome_arguments():
+        chrome_options.add_argument(argument)
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    return chrome_options
+
+def debugger_alive(address=CHROME_DEBUG_ADDRESS, timeout=0.5):
+    # One local HTTP request; no process scanning
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, ValueError):
+        return False
+
+def launch_debuggable_chrome(address=CHROME_DEBUG_ADDRESS, timeout=CHROME_LAUNCH_TIMEOUT):
+    # Starts Chrome detached from this process so it stays up for the next run
+    binary = driver_resolver.find_chrome_binary()
+    if not binary:
+        logging.warning("Chrome binary not found; set CHROME_BINARY to launch it for attaching")
+        return False
+    detach = {"start_new_session": True}
+    if os.name == "nt":
+        detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    subprocess.Popen([binary, *chrome_arguments(), "about:blank"],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **detach)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if debugger_alive(address):
+            return True
+        time.sleep(0.2)
+    logging.warning(f"Chrome did not open its debugging port at {address} within {timeout}s")
+    return False
+
+def start_driver(attach=CHROME_ATTACH):
+    # Returns (driver, attached). Attaching skips the process scan, the kill
+    # and sleep, and the browser cold start.
+    with span("browser_start") as start:
+        if attach:
+            warm = debugger_alive()
+            if warm or launch_debuggable_chrome():
+                print(f"🌐 {'Attaching to running' if warm else 'Launched'} Chrome on {CHROME_DEBUG_ADDRESS}")
+                options = Options()
+                options.debugger_address = CHROME_DEBUG_ADDRESS
+                start.outcome = "attached" if warm else "launched"
+                return webdriver.Chrome(service=build_chrome_service(), options=options), True
+            print("⚠️ Could not reach Chrome's debugging port; falling back to a fresh Chrome")
+        print("🌐 Checking for and closing existing Chrome processes...")
+        close_chrome_processes()
+        print("🌐 Launching Chrome with 'Srivaths' profile")
+        start.outcome = "relaunched"
+        return webdriver.Chrome(service=build_chrome_service(), options=build_chrome_options()), False
+
+# --- Step 4: Resolve ChromeDriver ---
+def build_chrome_service():
+    # Cached, version-pinned driver; only the very first run needs the network
+    resolution = driver_resolver.resolve()
+    return Service(resolution["path"], log_path="chromedriver.log")
+
+driver = None
+wait = None
+waits = None
+tracer = None
+# Course page URL per subject, so later weeks on the same session skip the dashboard
+course_pages = {}
+
+# --- Step 5: Log in to the portal ---
+@timed("login")
+def login():
+    driver.get("chrome://version")
+    print("🌐 Checking 'Srivaths' profile")
+    driver.get(f"{PORTAL_URL}/auth/login")
+    print("🌐 Portal loaded successfully")
+    # A warm browser is usually still signed in and gets redirected to the dashboard
+    google_btn = wait.until(EC.any_of(
+        EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Sign in with Google')]")),
+        EC.url_contains(f"{PORTAL_URL}/student_dashboard"),
+    ))
+    if google_btn is True:
+        print("🎉 Already logged in!")
+        return
+    google_btn.click()
+    print("✅ Google Sign-In clicked")
+    driver.switch_to.window(driver.window_handles[0])
+    wait.until(EC.url_contains(f"{PORTAL_URL}/student_dashboard"))
+    print("🎉 Successfully logged in!")
+
+# --- Step 6–13: Navigate to the practice assignment page ---
+def switch_to_new_tab(known_tabs):
+    # Switches to a tab opened since known_tabs was taken; other tabs (such as
+    # the tab pool's) are never picked up by mistake
+    opened = [handle for handle in driver.window_handles if handle not in known_tabs]
+    if opened:
+        driver.switch_to.window(opened[-1])
+    return bool(opened)
+
+def open_course_page(subject_id):
+    driver.get(f"{PORTAL_URL}/student_dashboard/current_courses")
+    print("🔄 Navigating to Current Courses")
+    course_link = wait.until(EC.element_to_be_clickable(
+        (By.XPATH, f"//a[contains(@href, '{subject_id}')]")
+    ))
+    known_tabs = set(driver.window_handles)
+    course_link.click()
+    print(f"✅ '{subject_id}' course clicked")
+    try:
+        wait.until(EC.url_contains(subject_id))
+        print("🔄 Course page loaded (same or new tab)")
+    except TimeoutException:
+        print("⚠️ Course page not loaded; checking for new tab")
+        if switch_to_new_tab(known_tabs):
+            if subject_id in driver.current_url:
+                print(f"🔄 Switched to '{subject_id}' course tab")
+            else:
+                raise Exception("Failed to load course page or switch to course tab")
+        else:
+            raise Exception("No new tab opened and course page not loaded")
+
+def open_practice_assignment(subject_id, week):
+    # Walks dashboard -> course -> Week N dropdown -> Practice Assignment and
+    # returns the URL of the loaded practice page. Once a course page has been
+    # reached in this session, later weeks load it directly.
+    with span("course_navigation", subject=subject_id) as course:
+        if subject_id in course_pages:
+            driver.get(course_pages[subject_id])
+            print(f"🔄 Returning to the '{subject_id}' course page")
+            course.outcome = "direct"
+        else:
+            open_course_page(subject_id)
+            course_pages[subject_id] = driver.current_url
+    with span("week_expansion", week=week):
+        week_link = wait.until(EC.element_to_be_clickable(
+            (By.XPATH, f"//div[contains(@class, 'units__items-title') and contains(text(), 'Week {week}')]")
+        ))
+        # Scroll to Week link
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", week_link)
+        waits.element_stable(week_link, "nav:week_scroll")
+        week_link.click()
+        print(f"🔄 Clicked Week {week} to open dropdown")
+
+        # Scroll the dropdown container to ensure all subitems are loaded
+        try:
+            dropdown_container = driver.find_element(By.XPATH, f"//div[contains(@class, 'units__items-title') and contains(text(), 'Week {week}')]/following-sibling::div[contains(@class, 'units__subitems-show')]")
+            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", dropdown_container)
+            waits.dom_quiet("nav:dropdown_scroll")
+            print("🔄 Scrolled Week dropdown to load all subitems")
+        except NoSuchElementException:
+            print("⚠️ Could not find dropdown container to scroll; proceeding without scrolling")
+
+        # All Practice Assignment locators race in one wait; the first match wins
+        try:
+            practice_assignment_link, selector = locators.race(driver, "practice_link", week=week)
+        except TimeoutException:
+            logging.error("Could not find Practice Assignment link. Check Week dropdown for exact title.")
+            print(f"❌ Could not find Practice Assignment link. Please provide the exact link text from Week {week} dropdown.")
+            raise Exception("Practice Assignment link not found")
+        # Scroll to Practice Assignment link
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'center'});", practice_assignment_link)
+        waits.element_stable(practice_assignment_link, "nav:practice_scroll")
+        print(f"✅ Found Practice Assignment link with locator '{selector}'")
+
+        known_tabs = set(driver.window_handles)
+        practice_assignment_link.click()
+        print("✅ Practice Assignment clicked")
+        try:
+            locators.race(driver, "question_row", clickable=False)
+            print("🔄 Practice Assignment page loaded")
+        except TimeoutException:
+            if switch_to_new_tab(known_tabs):
+                print("🔄 Switched to Practice Assignment tab")
+            else:
+                print("⚠️ No new tab for Practice Assignment; staying on current tab")
+                logging.warning("No new tab opened for Practice Assignment; proceeding with current tab")
+    return driver.current_url
+
+def same_page(url, expected):
+    # Ignores the fragment, which the portal rewrites as the page scrolls
+    return url.split("#", 1)[0].rstrip("/") == expected.split("#", 1)[0].rstrip("/")
+
+def open_cached_practice(subject_id, week, routes):
+    # Loads a cached Practice Assignment URL directly. Returns the loaded URL, or
+    # None on a miss (nothing cached, redirected, or no question rows), in which
+    # case the cached route is dropped and the caller walks the click path.
+    url = routes.get(subject_id, week)
+    if not url:
+        return None
+    with span("deep_link", subject=subject_id, week=week) as link:
+        driver.get(url)
+        try:
+            locators.race(driver, "question_row", DEEP_LINK_TIMEOUT, clickable=False)
+            loaded = same_page(driver.current_url, url)
+        except TimeoutException:
+            loaded = False
+        if not loaded:
+            link.outcome = "miss"
+            logging.warning(f"Cached route for {subject_id} week {week} missed (now at {driver.current_url}); using the click path")
+            print("⚠️ Cached Practice Assignment link did not load; navigating through the course page")
+            routes.forget(subject_id, week)
+            return None
+        link.outcome = "hit"
+    routes.hit(subject_id, week)
+    print("⚡ Opened Practice Assignment from the cached link")
+    return driver.current_url
+
+def is_practice_page_alive(practice_url):
+    # Cheap liveness check: one round trip confirming the current tab is still
+    # on the practice page and its question rows are attached to the DOM.
+    if not practice_url:
+        return False
+    try:
+        current_url, row_count = driver.execute_script(
+            "return [window.location.href, "
+            "document.querySelectorAll(\"div[class*='gcb-question-row']\").length];"
+        )
+    except WebDriverException as e:
+        logging.warning(f"Liveness check failed: {e}")
+        return False
+    return same_page(current_url, practice_url) and row_count > 0
+
+def ensure_practice_assignment(subject_id, week, practice_url=None, max_retries=3):
+    # Reuses the already-loaded practice page and only re-navigates when the
+    # liveness check shows it has gone stale.
+    with span("practice_navigation", week=week) as nav:
+        if is_practice_page_alive(practice_url):
+            logging.info(f"Reusing loaded Practice Assignment page: {practice_url}")
+            print("♻️ Practice Assignment page still loaded; skipping navigation")
+            nav.outcome = "reused"
+            return practice_url
+        routes = RouteCache() if ROUTE_CACHE_ENABLED else None
+        if routes:
+            practice_url = open_cached_practice(subject_id, week, routes)
+            if practice_url:
+                nav.outcome = "deep_link"
+                return practice_url
+        for attempt in range(max_retries):
+            try:
+                practice_url = open_practice_assignment(subject_id, week)
+                if routes:
+                    routes.put(subject_id, week, practice_url)
+                return practice_url
+            except (TimeoutException, WebDriverException) as e:
+                # A remembered course page that no longer works is walked to again on the retry
+                course_pages.pop(subject_id, None)
+                logging.warning(f"Navigation attempt {attempt + 1} failed: {e}")
+                print(f"⚠️ Navigation attempt {attempt + 1} failed: {e}")
+                if attempt < max_retries - 1:
+                    print("Retrying...")
+                    nav.retry()
+                    time.sleep(5)
+                else:
+                    logging.error("Max retries reached. Navigation failed.")
+                    print("❌ Max retries reached. Navigation failed.")
+                    raise
+
+# --- Step 14: Scrape and extract questions ---
+@timed("scrape")
+def scrape_questions():
+    print("🧠 Scraping questions from Practice Assignment page...")
+    # Force-load dynamic content
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    waits.settle("scrape:scroll_bottom", network=True)
+
+    # Debug capture: one page_source round trip, only when artifacts are persisted
+    if artifacts.active().persist:
+        artifacts.put("page_source", driver.page_source)
+
+    try:
+        locators.race(driver, "question_row", clickable=False)
+    except TimeoutException:
+        if artifacts.active().persist:
+            logging.error("Timeout waiting for question elements. Page source saved as the 'page_source' artifact")
+            print("❌ Timeout waiting for question elements. Check: python -m iitm_scraper.artifacts show latest page_source")
+        else:
+            logging.error("Timeout waiting for question elements")
+            print("❌ Timeout waiting for question elements. Set ARTIFACTS_PERSIST=1 to keep the page source.")
+        raise
+
+    # Expand all rows, wait once for the DOM to settle, then read every row in one script
+    expand_question_rows(driver)
+    waits.dom_quiet("scrape:expand_rows")
+    snapshot = snapshot_questions(driver)
+    questions = questions_from_snapshot(snapshot)
+
+    kept = {q["number"] for q in questions}
+    if artifacts.active().persist:
+        artifacts.put("question_dom", "".join(
+            f"Q{row['index']} DOM:\n{row['outer_html']}\n\n" for row in snapshot if f"Q{row['index']}" in kept
+        ))
+    if logging_setup.enabled(logging.DEBUG):
+        for row in snapshot:
+            if f"Q{row['index']}" in kept:
+                logging.debug("Q%s DOM: %.200s...", row["index"], row["outer_html"])
+
+    save_questions(questions)
+    return questions
+
+def resume_or_scrape(checkpoint):
+    # Skips the scrape when the checkpoint holds questions for the same page
+    # content (one round trip for the row texts); otherwise scrapes and commits
+    # the questions under the new page hash
+    if not checkpoint:
+        return scrape_questions()
+    with span("scrape", mode="checkpoint") as resumed:
+        locators.race(driver, "question_row", clickable=False)
+        content_hash = checkpoints.page_hash(row_texts(driver))
+        questions = checkpoint.questions_for(content_hash)
+        resumed.outcome = "checkpoint" if questions else "changed"
+    if questions:
+        logging.info(f"Page unchanged since checkpoint {content_hash[:12]}; reusing {len(questions)} questions")
+        print(f"♻️ Page unchanged since the last checkpoint; reusing {len(questions)} scraped questions")
+        return questions
+    questions = scrape_questions()
+    checkpoint.start_page(content_hash, questions)
+    return questions
+
+# ==== PART 3: Fill answers on the already-loaded page ====
+# The bulk apply (fill_plan.APPLY_JS) fills the page. A question whose bulk
+# apply failed has the same planned actions replayed here one input at a
+# time with native WebDriver calls, so both paths reach the same target state.
+def is_checked(element):
+    if element.tag_name.lower() == "input":
+        return element.is_selected()
+    return element.get_attribute("aria-checked") == "true"
+
+def apply_action(inputs, action):
+    # Returns None when the input reached its target state, else the reason it did not
+    if action["input"] >= len(inputs):
+        return f"input {action['input']} not found"
+    element = inputs[action["input"]]
+    if not element.is_enabled():
+        return f"input {action['input']} is disabled"
+    op = action["op"]
+    if op == "set_text":
+        element.clear()
+        element.send_keys(action["value"])
+        if element.get_attribute("value") != action["value"]:
+            return "text value did not stick"
+    elif op in ("check", "uncheck"):
+        want = op == "check"
+        if is_checked(element) != want:
+            driver.execute_script("arguments[0].click();", element)
+        if is_checked(element) != want:
+            return f"input {action['input']} did not {op}"
+    elif op == "select":
+        select = Select(element)
+        select.select_by_index(action["value"])
+        if select.first_selected_option.get_attribute("index") != str(action["value"]):
+            return "option did not stick"
+    else:
+        return f"unknown op {op}"
+    return None
+
+def fill_question(i, q_elem, actions, message):
+    # Replays one question's plan on its row; returns True when every input
+    # ended up in its target state
+    try:
+        # Scroll to question with centering
+        driver.execute_script("""
+            arguments[0].scrollIntoView({block: 'center', inline: 'center'});
+            window.scrollBy(0, -150);  // Adjust for headers
+        """, q_elem)
+        waits.settle("fill:question_scroll", element=q_elem)
+        logging.info(f"Scrolled to Q{i}")
+
+        # Rows were expanded before the snapshot, so inputs line up with the plan's ordinals
+        inputs = q_elem.find_elements(By.CSS_SELECTOR, INPUT_QUERY)
+        errors = [error for error in (apply_action(inputs, action) for action in actions) if error]
+    except WebDriverException as e:
+        errors = [str(e)]
+    if errors:
+        logging.error(f"Error processing Q{i}: {'; '.join(errors)}")
+        print(f"❌ Error processing Q{i}: {'; '.join(errors)}")
+        return False
+    logging.info(f"Q{i}: {message} (per-element)")
+    print(f"✅ Q{i}: {message}")
+    return True
+
+def snapshot_question_rows(num_questions):
+    try:
+        locators.race(driver, "question_row", clickable=False)
+    except TimeoutException:
+        logging.error("Timeout waiting for question elements during filling.")
+        print("❌ Timeout waiting for question elements during filling.")
+        raise
+
+    # Same expansion as the scrape, so collapsed rows report their inputs
+    expand_question_rows(driver)
+    waits.dom_quiet("fill:expand_rows")
+
+    # Current input state of every row in one round trip
+    snapshot = snapshot_questions(driver)
+    if len(snapshot) < num_questions:
+        logging.warning(f"Found only {len(snapshot)} question elements, expected {num_questions}")
+        print(f"⚠️ Found only {len(snapshot)} question elements, expected {num_questions}")
+    return {f"Q{row['index']}": row for row in snapshot}
+
+def apply_answers(batch, kinds, rows, checkpoint=None):
+    # Plans every answer in the batch against the snapshot and applies the whole
+    # plan in one script; returns (number, plan) for each question whose bulk apply failed
+    # Each question gets a fill span; the shared apply call is split evenly across the planned ones
+    def settled(number, status):
+        if checkpoint:
+            checkpoint.record_fill(number, status)
+
+    actions, planned = [], {}
+    for number, answer in batch:
+        started = time.perf_counter()
+        row = rows.get(number)
+        if not row:
+            logging.warning(f"{number}: No question element on the page, skipping")
+            print(f"⚠️ {number}: No question element on the page, skipping")
+            run_report.record("fill_question", time.perf_counter() - started, "missing", question=number)
+            settled(number, "missing")
+            continue
+        plan = plan_question(number, row, kinds.get(number), answer)
+        logging.info(f"Processing {number} ({kinds.get(number)}) with answer: {answer} -> {plan['status']}")
+        if plan["status"] == "already":
+            print(f"✅ {number}: {plan['message']}, skipping")
+        elif plan["status"] == "skip":
+            logging.warning(f"{number}: {plan['message']}")
+            print(f"⚠️ {number}: {plan['message']}, skipping")
+        else:
+            actions.extend(plan["actions"])
+            planned[number] = (plan, time.perf_counter() - started)
+            continue
+        run_report.record("fill_question", time.perf_counter() - started, plan["status"],
+                          question=number, kind=kinds.get(number))
+        settled(number, plan["status"])
+
+    with span("fill_apply", questions=len(planned), actions=len(actions)) as apply_span:
+        try:
+            report = apply_plan(driver, actions)
+        except WebDriverException as e:
+            logging.warning(f"Bulk apply failed for {list(planned)}: {e}")
+            apply_span.outcome = "error"
+            report = {number: {"applied": 0, "errors": [str(e)]} for number in planned}
+    apply_share = apply_span.duration / len(planned) if planned else 0.0
+
+    failed = []
+    for number, (plan, plan_time) in planned.items():
+        errors = report.get(number, {}).get("errors", [])
+        if errors:
+            logging.warning(f"{number}: Bulk apply failed ({'; '.join(errors)}); falling back to per-element fill")
+            failed.append((number, plan))
+        else:
+            logging.info(f"{number}: {plan['message']}")
+            print(f"✅ {number}: {plan['message']}")
+            settled(number, "filled")
+        run_report.record("fill_question", plan_time + apply_share, "fallback" if errors else "filled",
+                          question=number, kind=kinds.get(number), mode="bulk")
+    return failed
+
+@timed("fill")
+def fill_answers(answer_queue, questions, checkpoint=None, turn=contextlib.nullcontext):
+    # Consumes (question number, answer) pairs as the solver produces them, so
+    # filling starts on the first answer while later ones are still generating.
+    # Whatever has arrived is applied together in one bulk script. Page work
+    # runs inside turn() and waiting for answers outside it, so a tab pool can
+    # use the browser for other tabs in between.
+    print("🧠 Filling answers on Practice Assignment page...")
+    kinds = {q["number"]: q["kind"] for q in questions}
+    with turn():
+        rows = snapshot_question_rows(len(questions))
+    question_elements = None
+    done = False
+    while not done:
+        batch = [answer_queue.get()]
+        while True:
+            try:
+                batch.append(answer_queue.get_nowait())
+            except queue.Empty:
+                break
+        if None in batch:
+            done = True
+            batch = [item for item in batch if item is not None]
+        if not batch:
+            continue
+
+        with turn():
+            failed = apply_answers(batch, kinds, rows, checkpoint)
+            if failed and question_elements is None:
+                question_elements = driver.find_elements(By.XPATH, QUESTION_ROW_XPATH)
+            for number, plan in failed:
+                i = int(number[1:])
+                if not 0 < i <= len(question_elements):
+                    # The live page has fewer rows than were scraped (page changed since the scrape or checkpoint)
+                    logging.warning(f"{number}: No question element on the page, skipping")
+                    print(f"⚠️ {number}: No question element on the page, skipping")
+                    run_report.record("fill_question", 0.0, "missing", question=number, mode="per-element")
+                    if checkpoint:
+                        checkpoint.record_fill(number, "missing")
+                    continue
+                with span("fill_question", question=number, kind=kinds.get(number), mode="per-element") as fallback:
+                    ok = fill_question(i, question_elements[i - 1], plan["actions"], plan["message"])
+                    if not ok:
+                        fallback.outcome = "error"
+                if checkpoint:
+                    checkpoint.record_fill(number, "fallback" if ok else "failed")
+    print("🎉 Finished filling answers on Practice Assignment page.")
+
+# --- Submit by clicking "Check Answers" ---
+@timed("submit")
+def submit_answers():
+    print("📤 Submitting by clicking 'Check Answers'...")
+    try:
+        # Scroll to bottom to ensure button is visible
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        waits.dom_quiet("submit:scroll_bottom")
+
+        # "Check Answers", "Submit" and submit-input locators race in one wait
+        try:
+            check_button, selector = locators.race(driver, "check_button")
+            print(f"✅ Found 'Check Answers' button with locator '{selector}'")
+        except TimeoutException:
+            logging.error("Could not find 'Check Answers' or 'Submit' button.")
+            print("❌ Could not find 'Check Answers' or 'Submit' button. Please provide the exact button text or XPath.")
+            raise Exception("Check Answers/Submit button not found")
+
+        # Click the button
+        driver.execute_script("arguments[0].click();", check_button)
+        print("✅ 'Check Answers' button clicked successfully")
+
+        # Wait for confirmation (e.g., success message, URL change, or page update)
+        try:
+            wait.until(EC.presence_of_element_located(
+                (By.XPATH, "//div[contains(@class, 'success-message')] | //*[contains(text(), 'successfully')] | //*[contains(text(), 'checked')]")
+            ))
+            print("✅ Answers checked successfully")
+        except TimeoutException:
+            logging.warning("No confirmation message found; checking URL change")
+            if "submission" in driver.current_url.lower() or "completed" in driver.current_url.lower() or "checked" in driver.current_url.lower():
+                print("✅ Submission likely successful (URL changed)")
+            else:
+                print("⚠️ Could not confirm submission; please check the page")
+
+    except Exception as e:
+        logging.error(f"Error during 'Check Answers' submission: {str(e)}")
+        print(f"❌ Error during 'Check Answers' submission: {str(e)}")
+        raise
+
+def open_session(args):
+    # Starts or attaches to Chrome and signs in. The driver globals stay set for
+    # every job run on this session. Returns whether Chrome was attached.
+    global driver, wait, waits, tracer
+    course_pages.clear()
+    try:
+        driver, attached = start_driver(attach=not args.fresh_browser)
+        wait = WebDriverWait(driver, 30)
+        waits = WaitEngine(driver)
+        if args.trace_commands:
+            tracer = CommandTracer(driver).install()
+    except Exception as e:
+        logging.error(f"Failed to initialize ChromeDriver: {e}")
+        print(f"❌ Failed to initialize ChromeDriver: {e}")
+        print("Please ensure Chrome and ChromeDriver versions match. Try:")
+        print("1. Checking the cached driver: python -m iitm_scraper.driver_resolver status")
+        print("2. Refreshing it while online: python -m iitm_scraper.driver_resolver install")
+        print("3. Pinning a version with CHROMEDRIVER_VERSION, or pointing CHROMEDRIVER_PATH at a driver binary.")
+        print("4. Placing chromedriver (chromedriver.exe on Windows) in the project directory.")
+        raise
+    login()
+    return attached
+
+def session_alive():
+    # One round trip: is the driver still connected to a usable browser window?
+    if driver is None:
+        return False
+    try:
+        driver.current_url
+        return True
+    except WebDriverException as e:
+        logging.warning(f"Browser session lost: {e}")
+        return False
+
+def close_session(attached):
+    if driver is None:
+        return
+    if attached:
+        # Stop only chromedriver; Chrome keeps running with its session for the next run
+        driver.service.stop()
+        print(f"🌐 Leaving Chrome running on {CHROME_DEBUG_ADDRESS} for the next run.")
+    else:
+        driver.quit()
+
+def run_job(subject_id, week_number, args, turn=contextlib.nullcontext):
+    # One practice assignment on the open session: navigate, scrape, solve
+    # while filling, submit. Browser work happens inside turn(); the tab pool
+    # passes one that switches to this job's tab and holds the driver.
+    artifacts.start_run(f"{time.strftime('%Y%m%d-%H%M%S')}-{subject_id}-w{week_number}", subject=subject_id, week=week_number)
+    checkpoint = checkpoints.Checkpoint(subject_id, week_number) if checkpoints.CHECKPOINTS_ENABLED else None
+    try:
+        # Scrape, solve and fill stages share the same page handle
+        with turn():
+            practice_url = ensure_practice_assignment(subject_id, week_number)
+            questions = resume_or_scrape(checkpoint)
+
+        def record_answer(number, answer):
+            if checkpoint and answer != MISSING_ANSWER:
+                checkpoint.record_answer(number, answer)
+
+        # Answers stream into the fill stage while the model is still generating;
+        # answers committed by an interrupted run are replayed instead of solved
+        known = checkpoint.answers if checkpoint else None
+        answer_queue, solver_thread, solver_outcome = start_solver(questions, args.backend, known, record_answer)
+
+        print("\n🌐 Returning to Practice Assignment page to fill answers...")
+        try:
+            with turn():
+                practice_url = ensure_practice_assignment(subject_id, week_number, practice_url)
+            fill_answers(answer_queue, questions, checkpoint, turn)
+            solver_thread.join()
+            if "error" in solver_outcome:
+                raise solver_outcome["error"]
+            if checkpoint and checkpoint.submitted and not checkpoint.changed:
+                # Same page, same answers as the last submission: nothing new to check
+                print("♻️ Answers unchanged since the last submission; skipping 'Check Answers'")
+                run_report.record("submit", 0.0, "checkpoint")
+            else:
+                with turn():
+                    submit_answers()
+                if checkpoint:
+                    checkpoint.record_submit()
+        except Exception as e:
+            logging.error(f"Error during answer filling: {str(e)}")
+            print(f"❌ Error during answer filling: {str(e)}")
+            raise
+    finally:
+        if checkpoint:
+            checkpoint.flush()
+
+def finish_report(report, args):
+    # Adds this run's waits and command trace to the report and saves it;
+    # both are reset so the next job on the session starts from zero. The
+    # locator win counts are written here too, once per run.
+    locators.save_stats()
+    if waits:
+        waits.save_report()
+        report.extra["waits"] = waits.summary()
+        waits.timings.clear()
+    if tracer:
+        report.extra["commands"] = tracer.save()
+        tracer.reset()
+    report.save(args.report, args.prom_file)
+
+def release_session(attached):
+    # An attached Chrome is left running; a freshly launched one is kept open until Ctrl+C
+    if driver and attached:
+        close_session(attached)
+    elif driver:
+        print("🌐 Staying on the page after checking answers. Press Ctrl+C to interrupt and close the browser.")
+        try:
+            while True:
+                time.sleep(60)  # Sleep to keep the script running
+        except KeyboardInterrupt:
+            print("🛑 Browser closed manually via interruption.")
+            close_session(attached)
+
+def run_live(subject_id, week_number, args, profiler=None):
+    # One full browser run: login, navigate, scrape, solve while filling, submit.
+    report = run_report.start_run(subject=subject_id, week=week_number, backend=args.backend)
+    attached = False
+    try:
+        attached = open_session(args)
+        run_job(subject_id, week_number, args)
+    finally:
+        finish_report(report, args)
+        if profiler:
+            profiler.stop()
+        release_session(attached)
+
+def run_batch(subject_id, weeks, args, profiler=None):
+    # Several weeks of one subject back to back on one session: one browser
+    # start and login, the course page reached once, and one report covering
+    # every week. A failed week is recorded and the batch moves on.
+    report = run_report.start_run(subject=subject_id, weeks=",".join(map(str, weeks)),
+                                  backend=args.backend, mode="batch")
+    results = []
+    attached = False
+    try:
+        attached = open_session(args)
+        for position, week in enumerate(weeks, 1):
+            print(f"\n📅 Week {week} ({position}/{len(weeks)})")
+            with span("week", week=week) as week_span:
+                try:
+                    run_job(subject_id, week, args)
+                except Exception as e:
+                    logging.exception(f"Week {week} failed")
+                    print(f"❌ Week {week} failed: {e}")
+                    week_span.outcome = "error"
+                    week_span.set(error=str(e)[:300])
+            results.append({"week": week, "outcome": week_span.outcome,
+                            "seconds": round(week_span.duration, 3), "error": week_span.attrs.get("error")})
+            if week_span.outcome == "error" and not session_alive():
+                print("❌ Browser session lost; stopping the batch")
+                break
+        report.extra["weeks"] = results
+        print("\n📊 Batch summary:")
+        for result in results:
+            print(f"   Week {result['week']:<4}{result['outcome']:<8}{result['seconds']:>9.2f}s")
+        skipped = weeks[len(results):]
+        if skipped:
+            print(f"   Not run: weeks {', '.join(map(str, skipped))}")
+    finally:
+        finish_report(report, args)
+        if profiler:
+            profiler.stop()
+        release_session(attached)
@@ -0,0 +1,170 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import argparse
+import threading
+from .answer_cache import normalize_question
+
+# --- Stage checkpoints ---
+# One checkpoint per (subject, week), tied to a hash of the practice page's
+# question text. It holds the scraped questions, every parsed answer as it
+# arrives and the fill status of each question, so a run that failed after
+# scraping (LLM error, navigation timeout, crash mid-fill) resumes with only
+# the work that was left: an unchanged page skips the scrape, answered
+# questions skip the solver, and "Check Answers" is skipped when the page
+# was already submitted and nothing had to be changed. A different page
+# hash discards the old state.
+
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "checkpoints")
+CHECKPOINTS_ENABLED = os.getenv("CHECKPOINTS", "1").lower() in ("1", "true", "yes")
+# Answers and fill statuses are written at most this often (and on flush)
+CHECKPOINT_FLUSH_SECONDS = float(os.getenv("CHECKPOINT_FLUSH_SECONDS", "1"))
+
+# Fill statuses that mean this run changed the page (a failed fill may have
+# changed part of it)
+CHANGED_STATUSES = {"filled", "fallback", "failed"}
+
+
+def page_hash(texts):
+    # texts: the text of every question row, in page order
+    payload = "\x1f".join(normalize_question(text) for text in texts)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def checkpoint_path(subject_id, week, root=CHECKPOINT_DIR):
+    return os.path.join(root, f"{subject_id}-w{week}.json")
+
+
+class Checkpoint:
+    def __init__(self, subject_id, week, root=CHECKPOINT_DIR):
+        self.path = checkpoint_path(subject_id, week, root)
+        self.lock = threading.Lock()
+        self.changed = 0
+        self._dirty = False
+        self._last_write = 0.0
+        self.state = self._load() or self._empty(subject_id, week)
+
+    @staticmethod
+    def _empty(subject_id, week, content_hash=None):
+        return {"subject": subject_id, "week": week, "page_hash": content_hash, "questions": [],
+                "answers": {}, "fill": {}, "submitted_at": None, "updated_at": None}
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.state["updated_at"] = time.time()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._last_write = time.monotonic()
+
+    def _touch(self):
+        # Called with the lock held: throttles writes while answers stream in
+        self._dirty = True
+        if time.monotonic() - self._last_write >= CHECKPOINT_FLUSH_SECONDS:
+            self._write()
+
+    def flush(self):
+        with self.lock:
+            if self._dirty:
+                self._write()
+
+    @property
+    def answers(self):
+        with self.lock:
+            return dict(self.state["answers"])
+
+    @property
+    def submitted(self):
+        return self.state["submitted_at"] is not None
+
+    def questions_for(self, content_hash):
+        if self.state["page_hash"] == content_hash and self.state["questions"]:
+            return self.state["questions"]
+        return None
+
+    def start_page(self, content_hash, questions):
+        # Commits the scrape; answers and fill state only survive an unchanged page
+        with self.lock:
+            if self.state["page_hash"] != content_hash:
+                if self.state["page_hash"]:
+                    logging.info(f"Page content changed; discarding checkpoint {self.path}")
+                self.state = self._empty(self.state["subject"], self.state["week"], content_hash)
+            self.state["questions"] = questions
+            self._write()
+
+    def record_answer(self, number, answer):
+        with self.lock:
+            self.state["answers"][number] = answer
+            self._touch()
+
+    def record_fill(self, number, status):
+        with self.lock:
+            self.state["fill"][number] = status
+            if status in CHANGED_STATUSES:
+                self.changed += 1
+            self._touch()
+
+    def record_submit(self):
+        with self.lock:
+            self.state["submitted_at"] = time.time()
+            self._write()
+
+
+def list_checkpoints(root=CHECKPOINT_DIR):
+    if not os.path.isdir(root):
+        return []
+    names = sorted(name for name in os.listdir(root) if name.endswith(".json"))
+    checkpoints = []
+    for name in names:
+        with open(os.path.join(root, name), "r", encoding="utf-8") as f:
+            checkpoints.append(json.load(f))
+    return checkpoints
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the per-week stage checkpoints.")
+    parser.add_argument("--dir", default=CHECKPOINT_DIR, help=f"checkpoint directory (default: {CHECKPOINT_DIR})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="show each checkpoint's progress")
+    clear_cmd = commands.add_parser("clear", help="delete checkpoints (all of them unless filtered)")
+    clear_cmd.add_argument("--subject", help="only checkpoints of this subject id")
+    clear_cmd.add_argument("--week", type=int, help="only this week (needs --subject)")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for state in list_checkpoints(args.dir):
+            filled = sum(1 for status in state["fill"].values() if status in ("filled", "fallback", "already"))
+            submitted = time.strftime("%Y-%m-%d %H:%M", time.localtime(state["submitted_at"])) if state["submitted_at"] else "no"
+            print(f"{state['subject']} week {state['week']}: {len(state['questions'])} questions, "
+                  f"{len(state['answers'])} answered, {filled} filled, submitted={submitted}, "
+                  f"page={(state['page_hash'] or '-')[:12]}")
+    elif args.command == "clear":
+        if args.week is not None and not args.subject:
+            parser.error("--week needs --subject")
+        removed = 0
+        for state in list_checkpoints(args.dir):
+            if args.subject and state["subject"] != args.subject:
+                continue
+            if args.week is not None and state["week"] != args.week:
+                continue
+            os.remove(checkpoint_path(state["subject"], state["week"], args.dir))
+            removed += 1
+        print(f"🧹 Removed {removed} checkpoints")
+
+
+if __name__ == "__main__":
+    main()
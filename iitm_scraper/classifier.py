@@ -0,0 +1,30 @@
+# --- Question type classifier ---
+# Labels each question from the inputs recorded in its bulk DOM snapshot
+# (extraction.SNAPSHOT_JS / offline_parser), so the fill stage runs exactly
+# one handler per question instead of probing for every input kind.
+
+TEXT = "text"
+SINGLE_CHOICE = "single-choice"
+MULTI_CHOICE = "multi-choice"
+DROPDOWN_MATCHING = "dropdown-matching"
+RADIO_GRID_MATCHING = "radio-grid-matching"
+UNKNOWN = "unknown"
+
+QUESTION_TYPES = (TEXT, SINGLE_CHOICE, MULTI_CHOICE, DROPDOWN_MATCHING, RADIO_GRID_MATCHING, UNKNOWN)
+
+
+def classify_question(row):
+    inputs = row.get("inputs") or []
+    kinds = {record["kind"] for record in inputs}
+    if "select" in kinds:
+        return DROPDOWN_MATCHING
+    radio_groups = {record["name"] for record in inputs if record["kind"] == "radio" and record["name"]}
+    if len(radio_groups) > 1:
+        return RADIO_GRID_MATCHING
+    if "checkbox" in kinds:
+        return MULTI_CHOICE
+    if "radio" in kinds:
+        return SINGLE_CHOICE
+    if "text" in kinds:
+        return TEXT
+    return UNKNOWN
@@ -0,0 +1,141 @@
+import argparse
+
+# --- Command-line entry point ---
+# Importing this module is cheap and has no side effects. main() loads .env
+# first and only then imports the stage modules (their settings are read
+# from the environment at import time); Selenium is only imported for live
+# browser runs.
+#
+#   python -m iitm_scraper
+#   python -m iitm_scraper --from-html --parse-only
+
+# --- Subject Mapping ---
+# Mapping of subject names to their URL identifiers
+SUBJECT_MAPPING = {
+    "system commands": "ns_25t1_se2001",
+    "modern application development i": "ns_25t1_cs2003"
+}
+
+# --- Step 1: Prompt for Subject and Week Number ---
+def get_subject():
+    print("Available subjects:")
+    for subject in SUBJECT_MAPPING.keys():
+        print(f"- {subject}")
+    while True:
+        subject = input("Enter the subject name (e.g., 'system commands'): ").strip().lower()
+        if subject in SUBJECT_MAPPING:
+            return subject
+        print("Subject not found. Please choose from the available subjects.")
+
+def get_week_number():
+    while True:
+        try:
+            week = int(input("Enter the week number to complete (e.g., 1 for Week 1): "))
+            if week <= 0:
+                print("Please enter a positive number.")
+                continue
+            return week
+        except ValueError:
+            print("Please enter a valid number.")
+
+def parse_weeks(spec):
+    # "1-8", "1,3,5" or a mix such as "1-3,6", in the order given
+    weeks = []
+    for part in spec.split(","):
+        start, sep, end = part.strip().partition("-")
+        try:
+            first = int(start)
+            last = int(end) if sep else first
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid week list '{spec}' (use e.g. 1-8 or 1,3,5)")
+        if first <= 0 or last < first:
+            raise argparse.ArgumentTypeError(f"invalid week range '{part.strip()}'")
+        weeks.extend(week for week in range(first, last + 1) if week not in weeks)
+    return weeks
+
+
+def parse_args(argv=None):
+    from . import llm_backends
+    from . import run_report
+    from .command_trace import Profiler, TRACE_COMMANDS
+    parser = argparse.ArgumentParser(description="Scrape, solve and fill an IITM practice assignment.")
+    parser.add_argument("--from-html", nargs="?", const="latest", metavar="PATH",
+                        help="extract questions from a saved page source instead of a live browser "
+                             "(default: the latest persisted page_source artifact)")
+    parser.add_argument("--parse-only", action="store_true",
+                        help="with --from-html, stop after extracting questions (skip the LLM)")
+    parser.add_argument("--subject", type=str.lower, choices=sorted(SUBJECT_MAPPING),
+                        help="subject name (skips the prompt)")
+    parser.add_argument("--weeks", type=parse_weeks, metavar="LIST",
+                        help="run several weeks back to back on one browser session, e.g. 1-8 or 1,3,5 "
+                             "(one aggregated run report)")
+    parser.add_argument("--tabs", type=int, metavar="N",
+                        help="with --weeks, run up to N weeks at once in separate tabs of the one browser "
+                             "(default without this flag: one week after another)")
+    parser.add_argument("--backend", choices=sorted(llm_backends.BACKENDS), default=llm_backends.LLM_BACKEND,
+                        help=f"answer backend (default: {llm_backends.LLM_BACKEND}, from LLM_BACKEND)")
+    parser.add_argument("--report", default=run_report.RUN_REPORT_PATH, metavar="PATH",
+                        help=f"where to write the JSON run report (default: {run_report.RUN_REPORT_PATH})")
+    parser.add_argument("--prom-file", default=run_report.RUN_REPORT_PROM_PATH, metavar="PATH",
+                        help="also write run metrics as a Prometheus textfile (default: RUN_REPORT_PROM_PATH)")
+    parser.add_argument("--fresh-browser", action="store_true",
+                        help="kill Chrome and launch a new one instead of attaching to a running Chrome "
+                             "on the debugging port (or CHROME_ATTACH=0)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep one signed-in browser open and serve solve jobs on DAEMON_ADDRESS "
+                             "(send them with: python -m iitm_scraper.daemon submit SUBJECT WEEK)")
+    parser.add_argument("--trace-commands", action="store_true", default=TRACE_COMMANDS,
+                        help="count and time every WebDriver command by stage and question (or TRACE_COMMANDS=1)")
+    parser.add_argument("--profile", choices=Profiler.KINDS,
+                        help="profile the main thread with cProfile or pyinstrument")
+    parser.add_argument("--profile-out", metavar="PATH",
+                        help="profile output (default: profile.pstats or profile.html)")
+    args = parser.parse_args(argv)
+    if args.tabs is not None:
+        if args.tabs < 1:
+            parser.error("--tabs must be at least 1")
+        if not args.weeks:
+            parser.error("--tabs needs --weeks")
+    return args
+
+def main(argv=None):
+    # Environment variables from .env are loaded when the package is imported
+    args = parse_args(argv)
+
+    from . import logging_setup
+    from .command_trace import Profiler
+    # Set up logging (queued, rotating, per-stage levels; see logging_setup.py)
+    logging_setup.setup_logging()
+    profiler = Profiler(args.profile, args.profile_out).start() if args.profile else None
+
+    if args.from_html:
+        from .pipeline import run_from_html
+        try:
+            run_from_html(args.from_html, solve=not args.parse_only, backend_name=args.backend,
+                          report_path=args.report, prom_path=args.prom_file)
+        finally:
+            if profiler:
+                profiler.stop()
+        return
+
+    if args.daemon:
+        from .daemon import serve
+        serve(args, profiler=profiler)
+        return
+
+    subject = args.subject or get_subject()
+    subject_id = SUBJECT_MAPPING[subject]
+    if args.weeks:
+        print(f"🌟 You selected '{subject}' (ID: {subject_id}), Weeks {', '.join(map(str, args.weeks))}")
+        if args.tabs and args.tabs > 1:
+            from .tab_pool import run_pool
+            run_pool(subject_id, args.weeks, args, args.tabs, profiler)
+        else:
+            from .browser import run_batch
+            run_batch(subject_id, args.weeks, args, profiler)
+        return
+    week_number = get_week_number()
+    print(f"🌟 You selected '{subject}' (ID: {subject_id}), Week {week_number}")
+
+    from .browser import run_live
+    run_live(subject_id, week_number, args, profiler)
@@ -0,0 +1,198 @@
+import os
+import re
+import sys
+import time
+import logging
+import threading
+from collections import defaultdict
+from . import run_report
+
+# --- WebDriver command tracing ---
+# Opt-in proxy that counts and times every chromedriver command. Both driver
+# and WebElement calls go through the driver's execute(), so wrapping that
+# one method sees every round trip, including the getAttribute/isDisplayed
+# atoms Selenium sends as scripts. Each command is attributed to the run
+# report spans open at the time (stage and question number) and to the
+# repo functions that issued it. The result is written in the folded-stack
+# format read by flamegraph.pl and speedscope.
+#
+#   python -m iitm_scraper --trace-commands
+#   flamegraph.pl command_trace.folded > command_trace.svg
+
+TRACE_COMMANDS = os.getenv("TRACE_COMMANDS", "").lower() in ("1", "true", "yes")
+TRACE_FOLDED_PATH = os.getenv("TRACE_FOLDED_PATH", "command_trace.folded")
+TRACE_CALLER_DEPTH = 2
+
+SCRIPT_LABEL = re.compile(r"^/\*\s*(\w+)\s*\*/")
+_SKIP_PREFIXES = (
+    os.path.dirname(os.path.dirname(os.path.abspath(logging.__file__))),  # standard library
+    os.path.dirname(os.path.abspath(__file__)) + os.sep + "command_trace.py",
+    os.path.abspath(run_report.__file__),
+)
+
+
+def _is_repo_frame(filename):
+    filename = os.path.abspath(filename)
+    return "site-packages" not in filename and not filename.startswith(_SKIP_PREFIXES)
+
+
+def command_label(command, params):
+    # Selenium sends get_attribute()/is_displayed() as scripts tagged with a comment
+    if command in ("executeScript", "executeAsyncScript") and params:
+        match = SCRIPT_LABEL.match(params.get("script", ""))
+        if match:
+            return match.group(1)
+    return command
+
+
+class CommandTracer:
+    def __init__(self, driver, caller_depth=TRACE_CALLER_DEPTH):
+        self.driver = driver
+        self.caller_depth = caller_depth
+        self.stats = defaultdict(lambda: [0, 0.0])  # folded stack -> [count, seconds]
+        self.lock = threading.Lock()
+        self._execute = None
+
+    def install(self):
+        self._execute = self.driver.execute
+        self.driver.execute = self._traced
+        logging.info("WebDriver command tracing enabled")
+        return self
+
+    def uninstall(self):
+        if self._execute is not None:
+            del self.driver.execute
+            self._execute = None
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+
+    def _traced(self, command, params=None):
+        started = time.perf_counter()
+        try:
+            return self._execute(command, params)
+        finally:
+            elapsed = time.perf_counter() - started
+            stack = self._stack(command, params)
+            with self.lock:
+                entry = self.stats[stack]
+                entry[0] += 1
+                entry[1] += elapsed
+
+    def _callers(self):
+        callers, frame = [], sys._getframe(3)
+        while frame and len(callers) < self.caller_depth:
+            if _is_repo_frame(frame.f_code.co_filename):
+                callers.append(f"{frame.f_code.co_name} ({os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        return callers[::-1]
+
+    def _stack(self, command, params):
+        frames = []
+        for span in run_report.current_spans():
+            frames.append(span.name)
+            if span.attrs.get("question"):
+                frames.append(span.attrs["question"])
+        if not frames:
+            frames.append("unattributed")
+        return tuple(frames + self._callers() + [command_label(command, params)])
+
+    def summary(self, top=15):
+        with self.lock:
+            items = [(stack, count, seconds) for stack, (count, seconds) in self.stats.items()]
+        by_command, by_stage, by_question = defaultdict(lambda: [0, 0.0]), defaultdict(lambda: [0, 0.0]), defaultdict(lambda: [0, 0.0])
+        for stack, count, seconds in items:
+            spans = [frame for frame in stack if not frame.startswith("Q") and "(" not in frame][:-1]
+            questions = [frame for frame in stack if re.fullmatch(r"Q\d+", frame)]
+            for table, key in ((by_command, stack[-1]), (by_stage, ";".join(spans) or "unattributed")):
+                table[key][0] += count
+                table[key][1] += seconds
+            if questions:
+                by_question[questions[-1]][0] += count
+                by_question[questions[-1]][1] += seconds
+
+        def rows(table):
+            ordered = sorted(table.items(), key=lambda item: item[1][1], reverse=True)
+            return {key: {"commands": count, "seconds": round(seconds, 4)} for key, (count, seconds) in ordered}
+
+        hottest = sorted(items, key=lambda item: item[2], reverse=True)[:top]
+        return {
+            "total_commands": sum(count for _, count, _ in items),
+            "total_seconds": round(sum(seconds for _, _, seconds in items), 4),
+            "by_command": rows(by_command),
+            "by_stage": rows(by_stage),
+            "by_question": rows(by_question),
+            "hottest_stacks": [
+                {"stack": ";".join(stack), "commands": count, "seconds": round(seconds, 4)}
+                for stack, count, seconds in hottest
+            ],
+        }
+
+    def write_folded(self, path=TRACE_FOLDED_PATH):
+        # One "frame;frame;command microseconds" line per distinct stack
+        with self.lock:
+            items = sorted(self.stats.items())
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, (_, seconds) in items:
+                frames = ";".join(frame.replace(";", ",").replace(" ", "_") for frame in stack)
+                f.write(f"{frames} {max(1, int(seconds * 1_000_000))}\n")
+        logging.info(f"Command trace saved to {path}")
+
+    def print_summary(self, top=15):
+        summary = self.summary(top)
+        print(f"\n🔍 {summary['total_commands']} WebDriver commands, {summary['total_seconds']:.2f}s in round trips")
+        print(f"{'commands':>9}{'total ms':>11}{'avg ms':>9}  stack")
+        for row in summary["hottest_stacks"]:
+            avg = row["seconds"] / row["commands"] * 1000 if row["commands"] else 0.0
+            print(f"{row['commands']:>9}{row['seconds'] * 1000:>11.1f}{avg:>9.2f}  {row['stack']}")
+        return summary
+
+    def save(self, path=TRACE_FOLDED_PATH):
+        self.write_folded(path)
+        summary = self.print_summary()
+        print(f"🔥 Flame graph input saved to {path}")
+        return summary
+
+
+class Profiler:
+    # Python-side profile of the main thread alongside the command trace.
+    # pyinstrument is optional; cProfile is always available.
+    KINDS = ("cprofile", "pyinstrument")
+    DEFAULT_PATHS = {"cprofile": "profile.pstats", "pyinstrument": "profile.html"}
+
+    def __init__(self, kind, path=None):
+        self.kind = kind
+        self.path = path or self.DEFAULT_PATHS[kind]
+        self._profiler = None
+
+    def start(self):
+        if self.kind == "cprofile":
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            try:
+                from pyinstrument import Profiler as PyinstrumentProfiler
+            except ImportError:
+                logging.warning("pyinstrument is not installed; profiling disabled")
+                print("⚠️ pyinstrument is not installed (pip install pyinstrument); profiling disabled")
+                return self
+            self._profiler = PyinstrumentProfiler()
+            self._profiler.start()
+        logging.info(f"{self.kind} profiling started")
+        return self
+
+    def stop(self):
+        if self._profiler is None:
+            return
+        profiler, self._profiler = self._profiler, None
+        if self.kind == "cprofile":
+            profiler.disable()
+            profiler.dump_stats(self.path)
+        else:
+            profiler.stop()
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+        logging.info(f"{self.kind} profile saved to {self.path}")
+        print(f"⏱️ {self.kind} profile saved to {self.path}")
@@ -0,0 +1,302 @@
+import os
+import json
+import queue
+import logging
+import argparse
+import itertools
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from . import run_report
+
+# --- Solve daemon ---
+# Keeps one warm, signed-in browser session and runs (subject, week) jobs
+# against it, so a job only pays for navigation, scraping, solving and
+# filling. Jobs arrive over local HTTP and run one at a time on a single
+# worker thread (the driver is not thread-safe); each job's run report is
+# returned to the caller and also saved like a normal run.
+#
+#   python -m iitm_scraper --daemon                          # start and sign in once
+#   python -m iitm_scraper.daemon submit "system commands" 3
+#   python -m iitm_scraper.daemon status
+#   python -m iitm_scraper.daemon stop                       # finish the running job, drop the queue
+#
+# Endpoints: POST /jobs {"subject": name or id, "week": N, "wait": true},
+# GET /status, POST /shutdown.
+
+DEFAULT_DAEMON_ADDRESS = "127.0.0.1:8766"
+
+
+def daemon_address():
+    # Read on use, so the server and the client commands agree on .env's DAEMON_ADDRESS
+    return os.getenv("DAEMON_ADDRESS", DEFAULT_DAEMON_ADDRESS)
+
+
+def split_address(address):
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+def resolve_subject(subject):
+    # Accepts a subject name from SUBJECT_MAPPING or its URL identifier
+    from .cli import SUBJECT_MAPPING
+    subject = str(subject).strip().lower()
+    if subject in SUBJECT_MAPPING:
+        return SUBJECT_MAPPING[subject]
+    if subject in SUBJECT_MAPPING.values():
+        return subject
+    raise ValueError(f"Unknown subject '{subject}'; choose from {sorted(SUBJECT_MAPPING)}")
+
+
+class Job:
+    def __init__(self, job_id, subject_id, week):
+        self.id = job_id
+        self.subject_id = subject_id
+        self.week = week
+        self.status = "queued"
+        self.result = None
+        self.done = threading.Event()
+
+    def describe(self):
+        return {"job": self.id, "subject": self.subject_id, "week": self.week, "status": self.status}
+
+
+class SolveDaemon:
+    def __init__(self, args):
+        self.args = args
+        self.jobs = queue.Queue()
+        self.ids = itertools.count(1)
+        self.current = None
+        self.completed = 0
+        self.attached = False
+        self.session_ok = False
+        self.worker = threading.Thread(target=self._work, name="daemon-worker", daemon=True)
+
+    def open_session(self):
+        from . import browser
+        # Session start-up (driver start, login) gets its own report
+        report = run_report.start_run(mode="daemon-session", backend=self.args.backend)
+        try:
+            self.attached = browser.open_session(self.args)
+            self.session_ok = True
+        finally:
+            browser.finish_report(report, self.args)
+
+    def start(self):
+        self.open_session()
+        self.worker.start()
+
+    def submit(self, subject_id, week):
+        job = Job(next(self.ids), subject_id, week)
+        self.jobs.put(job)
+        logging.info(f"Daemon queued job {job.id}: {subject_id} week {week}")
+        return job
+
+    def status(self):
+        return {
+            "session": self.session_ok,
+            "attached": self.attached,
+            "completed": self.completed,
+            "queued": self.jobs.qsize(),
+            "current": self.current.describe() if self.current else None,
+        }
+
+    def stop(self):
+        # The running job finishes; jobs still queued are failed so their callers return
+        self._cancel_queued()
+        self.jobs.put(None)
+        if self.worker.is_alive():
+            self.worker.join()
+        self._cancel_queued()
+
+    def _cancel_queued(self):
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is None:
+                continue
+            logging.info(f"Daemon stopping; cancelled queued job {job.id}")
+            job.status = "cancelled"
+            job.result = {"job": job.id, "subject": job.subject_id, "week": job.week, "status": "cancelled",
+                          "error": "daemon stopped before the job started", "report": None}
+            job.done.set()
+
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            self.current = job
+            job.status = "running"
+            job.result = self._run(job)
+            job.status = job.result["status"]
+            self.current = None
+            self.completed += 1
+            job.done.set()
+
+    def _run(self, job):
+        from . import browser
+        result = {"job": job.id, "subject": job.subject_id, "week": job.week, "error": None, "report": None}
+        if not self.session_ok or not browser.session_alive():
+            # Chrome was closed or crashed between jobs: start over before giving up on the job
+            print("🔁 Browser session lost; starting a new one...")
+            self.session_ok = False
+            try:
+                self.open_session()
+            except Exception as e:
+                logging.error(f"Daemon could not reopen the browser session: {e}")
+                return dict(result, status="error", error=f"session: {e}")
+
+        print(f"\n🛰️ Job {job.id}: {job.subject_id} week {job.week}")
+        report = run_report.start_run(subject=job.subject_id, week=job.week, backend=self.args.backend,
+                                      job=job.id, mode="daemon")
+        status = "ok"
+        try:
+            browser.run_job(job.subject_id, job.week, self.args)
+        except Exception as e:
+            logging.exception(f"Daemon job {job.id} failed")
+            status, result["error"] = "error", str(e)
+        finally:
+            browser.finish_report(report, self.args)
+        print(f"{'✅' if status == 'ok' else '❌'} Job {job.id} finished ({status})")
+        return dict(result, status=status, report=report.to_dict())
+
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    daemon = None
+
+    def _reply(self, code, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/status":
+            self.send_error(404)
+            return
+        self._reply(200, self.daemon.status())
+
+    def do_POST(self):
+        if self.path == "/shutdown":
+            self._reply(200, {"stopping": True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        if self.path != "/jobs":
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            subject_id = resolve_subject(payload["subject"])
+            week = int(payload["week"])
+            if week <= 0:
+                raise ValueError("week must be a positive number")
+        except (KeyError, ValueError, TypeError) as e:
+            self._reply(400, {"error": str(e)})
+            return
+        job = self.daemon.submit(subject_id, week)
+        if not payload.get("wait", True):
+            self._reply(202, dict(job.describe(), queued=self.daemon.jobs.qsize()))
+            return
+        job.done.wait()
+        self._reply(200, job.result)
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+
+def serve(args, address=None, profiler=None):
+    from . import browser
+    address = address or daemon_address()
+    daemon = SolveDaemon(args)
+    try:
+        daemon.start()
+        handler = type("ConfiguredDaemonHandler", (DaemonHandler,), {"daemon": daemon})
+        server = ThreadingHTTPServer(split_address(address), handler)
+        print(f"🛰️ Daemon ready on http://{address} — submit jobs with: "
+              f"python -m iitm_scraper.daemon submit \"system commands\" 3")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            daemon.stop()
+    finally:
+        if profiler:
+            profiler.stop()
+        browser.close_session(daemon.attached)
+        print("🛑 Daemon stopped")
+
+
+def request(address, method, path, payload=None, timeout=None):
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urllib.request.Request(f"http://{address}{path}", data=data, method=method,
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return json.loads(response.read() or b"{}")
+    except urllib.error.HTTPError as e:
+        return dict(json.loads(e.read() or b"{}"), http_status=e.code)
+
+
+def print_result(result):
+    if "http_status" in result:
+        print(f"❌ Rejected: {result.get('error')}")
+        return
+    if "queued" in result:
+        print(f"📥 Job {result['job']} accepted ({result['status']}, {result['queued']} waiting)")
+        return
+    print(f"{'✅' if result['status'] == 'ok' else '❌'} Job {result['job']}: {result['subject']} "
+          f"week {result['week']} — {result['status']}")
+    if result.get("error"):
+        print(f"   {result['error']}")
+    report = result.get("report") or {}
+    if report:
+        print(f"   Run took {report['duration']:.2f}s")
+    for name, stats in report.get("summary", {}).items():
+        print(f"   {name:<22}{stats['count']:>5}{stats['total']:>9.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send solve jobs to a running iitm_scraper daemon.")
+    parser.add_argument("--address", help=f"daemon host:port (default: DAEMON_ADDRESS, or {DEFAULT_DAEMON_ADDRESS})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    submit_cmd = commands.add_parser("submit", help="run one practice assignment on the warm session")
+    submit_cmd.add_argument("subject", help="subject name (e.g. 'system commands') or id")
+    submit_cmd.add_argument("week", type=int)
+    submit_cmd.add_argument("--no-wait", action="store_true", help="queue the job and return immediately")
+    submit_cmd.add_argument("--json", help="also write the job result (with its run report) to this file")
+    commands.add_parser("status", help="show the session state and the job queue")
+    commands.add_parser("stop", help="finish the running job, cancel queued ones, then stop the daemon")
+    args = parser.parse_args()
+    args.address = args.address or daemon_address()
+
+    try:
+        if args.command == "submit":
+            result = request(args.address, "POST", "/jobs",
+                             {"subject": args.subject, "week": args.week, "wait": not args.no_wait})
+            print_result(result)
+            if args.json:
+                with open(args.json, "w", encoding="utf-8") as f:
+                    json.dump(result, f, indent=2)
+            if result.get("status") not in ("ok", "queued", "running"):
+                raise SystemExit(1)
+        elif args.command == "status":
+            print(json.dumps(request(args.address, "GET", "/status", timeout=5), indent=2))
+        elif args.command == "stop":
+            request(args.address, "POST", "/shutdown", timeout=5)
+            print(f"🛑 Stop requested for the daemon on {args.address}")
+    except urllib.error.URLError as e:
+        print(f"❌ No daemon on {args.address}: {e.reason}. Start one with: python -m iitm_scraper --daemon")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import os
+import re
+import json
+import shutil
+import logging
+import argparse
+import platform
+import subprocess
+from .run_report import span
+
+# --- ChromeDriver resolution ---
+# Finds a chromedriver binary without touching the network on normal runs:
+#   1. CHROMEDRIVER_PATH, if set
+#   2. a chromedriver / chromedriver.exe next to the project (the old setup)
+#   3. a cached binary matching CHROMEDRIVER_VERSION or the local Chrome's
+#      major version, from CHROMEDRIVER_CACHE_DIR
+# Only when nothing is cached is webdriver-manager used to download a
+# driver, which is then copied into the cache and pinned by version. Run
+# "python -m iitm_scraper.driver_resolver install" once while online to
+# make later runs fully offline.
+
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+CHROMEDRIVER_VERSION = os.getenv("CHROMEDRIVER_VERSION")  # full ("124.0.6367.91") or major ("124")
+CHROMEDRIVER_CACHE_DIR = os.path.expanduser(os.getenv(
+    "CHROMEDRIVER_CACHE_DIR", os.path.join("~", ".cache", "iitm_scraper", "chromedriver")
+))
+CHROME_BINARY = os.getenv("CHROME_BINARY")
+DRIVER_NAME = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+VERSION_PATTERN = re.compile(r"\d+\.\d+\.\d+\.\d+")
+# Newest driver of a major version, published by Chrome for Testing (Chrome 115 and later)
+LATEST_RELEASE_URL = "https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{major}"
+
+WINDOWS_CHROME_DIRS = [
+    os.path.join(os.environ.get("PROGRAMFILES", r"C:\Program Files"), "Google", "Chrome", "Application"),
+    os.path.join(os.environ.get("PROGRAMFILES(X86)", r"C:\Program Files (x86)"), "Google", "Chrome", "Application"),
+    os.path.join(os.environ.get("LOCALAPPDATA", ""), "Google", "Chrome", "Application"),
+]
+MAC_CHROME_APPS = ["/Applications/Google Chrome.app", os.path.expanduser("~/Applications/Google Chrome.app")]
+LINUX_CHROME_NAMES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+
+class DriverResolutionError(Exception):
+    pass
+
+
+def major_of(version):
+    return version.split(".", 1)[0] if version else None
+
+
+def version_key(version):
+    # Non-numeric parts (an index written by an older release) sort lowest
+    return tuple(int(part) if part.isdigit() else -1 for part in version.split("."))
+
+
+def _version_from_binary(path):
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning(f"Could not run {path} --version: {e}")
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def _windows_chrome_version():
+    # Registry first (no process start), then the versioned folders of the install
+    try:
+        import winreg
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                    return winreg.QueryValueEx(key, "version")[0]
+            except OSError:
+                continue
+    except ImportError:
+        pass
+    for directory in WINDOWS_CHROME_DIRS:
+        if os.path.isdir(directory):
+            versions = [name for name in os.listdir(directory) if VERSION_PATTERN.fullmatch(name)]
+            if versions:
+                return max(versions, key=version_key)
+    return None
+
+
+def _mac_chrome_version():
+    import plistlib
+    for app in MAC_CHROME_APPS:
+        path = os.path.join(app, "Contents", "Info.plist")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return plistlib.load(f).get("CFBundleShortVersionString")
+    return None
+
+
+def find_chrome_binary():
+    if CHROME_BINARY:
+        return CHROME_BINARY
+    system = platform.system()
+    if system == "Windows":
+        candidates = [os.path.join(directory, "chrome.exe") for directory in WINDOWS_CHROME_DIRS]
+    elif system == "Darwin":
+        candidates = [os.path.join(app, "Contents", "MacOS", "Google Chrome") for app in MAC_CHROME_APPS]
+    else:
+        candidates = [shutil.which(name) for name in LINUX_CHROME_NAMES]
+    return next((path for path in candidates if path and os.path.exists(path)), None)
+
+
+def detect_chrome_version():
+    if CHROME_BINARY:
+        return _version_from_binary(CHROME_BINARY)
+    system = platform.system()
+    if system == "Windows":
+        return _windows_chrome_version()
+    if system == "Darwin":
+        return _mac_chrome_version()
+    binary = find_chrome_binary()
+    return _version_from_binary(binary) if binary else None
+
+
+class DriverCache:
+    # <cache dir>/<driver version>/chromedriver, indexed by index.json
+    def __init__(self, root=CHROMEDRIVER_CACHE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+
+    def entries(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        return {version: path for version, path in entries.items() if os.path.exists(path)}
+
+    def find(self, wanted):
+        # wanted is a full version (exact match first) or a major version
+        entries = self.entries()
+        if wanted in entries:
+            return wanted, entries[wanted]
+        same_major = [version for version in entries if major_of(version) == major_of(wanted)]
+        if same_major:
+            version = max(same_major, key=version_key)
+            return version, entries[version]
+        return None, None
+
+    def add(self, source_path, version):
+        directory = os.path.join(self.root, version)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, DRIVER_NAME)
+        shutil.copy2(source_path, path)
+        os.chmod(path, 0o755)
+        entries = self.entries()
+        entries[version] = path
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        return path
+
+    def clear(self):
+        if os.path.isdir(self.root):
+            shutil.rmtree(self.root)
+
+
+def latest_for_major(major):
+    import urllib.request
+    try:
+        with urllib.request.urlopen(LATEST_RELEASE_URL.format(major=major), timeout=15) as response:
+            version = response.read().decode("utf-8").strip()
+    except OSError as e:
+        raise DriverResolutionError(f"Could not look up the newest ChromeDriver {major}: {e}")
+    if not VERSION_PATTERN.fullmatch(version):
+        raise DriverResolutionError(f"No ChromeDriver release found for Chrome {major}")
+    return version
+
+
+def download_version(version):
+    # The exact version to hand to webdriver-manager; None lets it match the local Chrome
+    if not version:
+        return None
+    if VERSION_PATTERN.fullmatch(version):
+        return version
+    if not version.isdigit():
+        raise DriverResolutionError(
+            f"Invalid ChromeDriver version '{version}': use a full version such as 124.0.6367.91 "
+            "or a major such as 124"
+        )
+    if major_of(detect_chrome_version()) == version:
+        return None
+    return latest_for_major(version)
+
+
+def install(version=CHROMEDRIVER_VERSION, cache=None):
+    # Network step: download through webdriver-manager, then pin the binary in our cache
+    from webdriver_manager.chrome import ChromeDriverManager
+    cache = cache or DriverCache()
+    exact = download_version(version)
+    downloaded = ChromeDriverManager(driver_version=exact).install()
+    actual = _version_from_binary(downloaded) or exact
+    if not actual:
+        # Without a version the driver cannot be matched to Chrome later; use it
+        # for this run only
+        logging.warning(f"Could not read the version of {downloaded}; not caching it")
+        return None, downloaded
+    if version and major_of(actual) != major_of(version):
+        # Caching it would never satisfy the pin, and every run would download again
+        raise DriverResolutionError(f"Downloaded ChromeDriver {actual}, which does not match the pin {version}")
+    path = cache.add(downloaded, actual)
+    logging.info(f"Cached ChromeDriver {actual} at {path}")
+    return actual, path
+
+
+def resolve(cache=None, allow_download=True):
+    # Returns {"path", "version", "chrome_version", "source"}; recorded as a
+    # run report span so slow resolutions show up next to the other stages
+    cache = cache or DriverCache()
+    with span("driver_resolution") as resolution:
+        result = _resolve(cache, allow_download)
+        resolution.set(**result)
+        resolution.outcome = result["source"]
+    logging.info(f"ChromeDriver resolved from {result['source']} in {resolution.duration:.3f}s: {result['path']}")
+    return result
+
+
+def _resolve(cache, allow_download):
+    if CHROMEDRIVER_PATH:
+        return {"path": CHROMEDRIVER_PATH, "version": CHROMEDRIVER_VERSION, "chrome_version": None, "source": "env"}
+    local_path = os.path.join(os.getcwd(), DRIVER_NAME)
+    if os.path.exists(local_path):
+        return {"path": local_path, "version": None, "chrome_version": None, "source": "local"}
+
+    chrome_version = detect_chrome_version()
+    wanted = CHROMEDRIVER_VERSION or chrome_version
+    if wanted:
+        version, path = cache.find(wanted)
+    else:
+        # Chrome version unknown: fall back to the newest cached driver
+        entries = cache.entries()
+        version = max(entries, key=version_key) if entries else None
+        path = entries.get(version)
+    if path:
+        return {"path": path, "version": version, "chrome_version": chrome_version, "source": "cache"}
+
+    if not allow_download:
+        raise DriverResolutionError(
+            f"No cached ChromeDriver for Chrome {wanted or '(version unknown)'} in {cache.root}. "
+            "Run 'python -m iitm_scraper.driver_resolver install' while online."
+        )
+    logging.info(f"No cached ChromeDriver for {wanted}; downloading with webdriver-manager")
+    print(f"⬇️ Downloading ChromeDriver for Chrome {wanted or '(version unknown)'} (first run only)")
+    version, path = install(CHROMEDRIVER_VERSION, cache)
+    return {"path": path, "version": version, "chrome_version": chrome_version, "source": "download"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the pinned, cached ChromeDriver.")
+    parser.add_argument("--cache-dir", default=CHROMEDRIVER_CACHE_DIR, help=f"driver cache (default: {CHROMEDRIVER_CACHE_DIR})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="show the local Chrome version, the pin and the cached drivers")
+    install_cmd = commands.add_parser("install", help="download a driver into the cache (needs network)")
+    install_cmd.add_argument("--version", default=CHROMEDRIVER_VERSION,
+                             help="driver version to pin, full (124.0.6367.91) or major (124) "
+                                  "(default: CHROMEDRIVER_VERSION, else match the local Chrome)")
+    commands.add_parser("clear", help="delete every cached driver")
+    args = parser.parse_args()
+
+    cache = DriverCache(args.cache_dir)
+    if args.command == "status":
+        print(f"Chrome version: {detect_chrome_version() or 'not found'}")
+        print(f"Pinned version: {CHROMEDRIVER_VERSION or 'none (follows Chrome)'}")
+        for version, path in sorted(cache.entries().items(), key=lambda item: version_key(item[0])):
+            print(f"    {version:<16} {path}")
+        try:
+            result = _resolve(cache, allow_download=False)
+            print(f"Next run uses: {result['path']} ({result['source']})")
+        except DriverResolutionError as e:
+            print(f"⚠️ {e}")
+    elif args.command == "install":
+        try:
+            version, path = install(args.version, cache)
+        except DriverResolutionError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        if version:
+            print(f"✅ ChromeDriver {version} cached at {path}")
+        else:
+            print(f"⚠️ Downloaded {path}, but its version is unknown so it was not cached")
+    elif args.command == "clear":
+        cache.clear()
+        print(f"🧹 Cleared {args.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
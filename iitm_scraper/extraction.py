@@ -0,0 +1,127 @@
+import json
+import logging
+from .classifier import classify_question
+
+# --- Bulk question extraction ---
+# Reads every gcb-question-row in a single execute_script call instead of
+# issuing click/find_element/.text/get_attribute commands per row.
+
+EXPAND_ROWS_JS = """
+var rows = document.querySelectorAll("div[class*='gcb-question-row']");
+rows.forEach(function (row) {
+    try { row.click(); } catch (e) {}
+});
+return rows.length;
+"""
+
+# Text of every row, for the checkpoint page hash; read before the rows are expanded
+ROW_TEXTS_JS = """
+return Array.prototype.map.call(
+    document.querySelectorAll("div[class*='gcb-question-row']"),
+    function (row) { return row.textContent; }
+);
+"""
+
+# Input records carry their ordinal in this query so later scripts can address them
+INPUT_QUERY = "input, textarea, select, [role='radio'], [role='checkbox']"
+
+SNAPSHOT_JS = """
+var INPUT_QUERY = "%s";
+
+function clean(text) { return (text || '').trim(); }
+
+function labelFor(row, input) {
+    if (input.id) {
+        var byFor = row.querySelector('label[for="' + CSS.escape(input.id) + '"]');
+        if (byFor) return clean(byFor.innerText);
+    }
+    var parent = input.parentElement;
+    if (parent && parent.tagName === 'LABEL') return clean(parent.innerText);
+    var sib = input.nextElementSibling;
+    while (sib && sib.tagName !== 'LABEL') sib = sib.nextElementSibling;
+    if (sib) return clean(sib.innerText);
+    return clean(input.getAttribute('aria-label') || input.innerText);
+}
+
+function kindOf(input) {
+    var tag = input.tagName.toLowerCase();
+    var role = input.getAttribute('role');
+    if (tag === 'select') return 'select';
+    if (tag === 'textarea') return 'text';
+    if (tag === 'input') {
+        var type = (input.getAttribute('type') || 'text').toLowerCase();
+        if (type === 'radio' || type === 'checkbox') return type;
+        if (['hidden', 'submit', 'button', 'reset', 'image', 'file'].indexOf(type) >= 0) return null;
+        return 'text';
+    }
+    if (role === 'radio' || role === 'checkbox') return role;
+    return null;
+}
+
+var rows = document.querySelectorAll("div[class*='gcb-question-row']");
+var out = [];
+rows.forEach(function (row, i) {
+    var body = row.querySelector("div[class*='qt-embedded']");
+    var kinds = [], labels = [], inputs = [];
+    row.querySelectorAll(INPUT_QUERY).forEach(function (input, ordinal) {
+        var kind = kindOf(input);
+        if (!kind) return;
+        if (kinds.indexOf(kind) < 0) kinds.push(kind);
+        var record = {kind: kind, ordinal: ordinal, name: input.getAttribute('name') || '', id: input.id || ''};
+        if (kind === 'select') {
+            record.value = input.value;
+            record.options = Array.prototype.map.call(input.options, function (opt) {
+                return {text: clean(opt.text), value: opt.value, selected: opt.selected};
+            });
+        } else if (kind === 'radio' || kind === 'checkbox') {
+            record.label = labelFor(row, input);
+            record.value = input.value !== undefined ? input.value : '';
+            record.checked = input.tagName === 'INPUT'
+                ? input.checked
+                : input.getAttribute('aria-checked') === 'true';
+            labels.push(record.label);
+        } else {
+            record.value = input.value;
+        }
+        inputs.push(record);
+    });
+    out.push({
+        index: i + 1,
+        text: body ? clean(body.innerText) : null,
+        outer_html: row.outerHTML,
+        input_kinds: kinds,
+        option_labels: labels,
+        inputs: inputs
+    });
+});
+return JSON.stringify(out);
+""" % INPUT_QUERY
+
+
+def expand_question_rows(driver):
+    return driver.execute_script(EXPAND_ROWS_JS)
+
+
+def row_texts(driver):
+    return driver.execute_script(ROW_TEXTS_JS) or []
+
+
+def snapshot_questions(driver):
+    return json.loads(driver.execute_script(SNAPSHOT_JS) or "[]")
+
+
+def questions_from_snapshot(snapshot):
+    questions = []
+    seen_texts = set()
+    for row in snapshot:
+        i = row["index"]
+        raw_text = (row.get("text") or "").strip()
+        logging.debug("Q%s raw text: %.200s...", i, raw_text)
+        if not raw_text or raw_text in seen_texts:
+            logging.warning(f"Skipping Q{i}: No text or duplicate")
+            continue
+        seen_texts.add(raw_text)
+        kind = classify_question(row)
+        logging.debug("Q%s classified as %s (inputs: %s)", i, kind, row.get("input_kinds"))
+        questions.append({"number": f"Q{i}", "raw_text": raw_text, "kind": kind})
+    return questions
@@ -0,0 +1,225 @@
+import re
+import json
+from . import classifier
+from .extraction import INPUT_QUERY
+
+# --- Batched form filling ---
+# Turns answers into a plan of (question id, input address, value) actions
+# using the bulk DOM snapshot, then applies the whole plan with one
+# execute_script call that sets values, fires input/change events and
+# reports per-question results. Inputs are addressed by row index plus
+# their ordinal in INPUT_QUERY, exactly as the snapshot recorded them.
+#
+# Planning is a reconciliation: each planner works out the target state of
+# every input from the answer, compares it with the snapshot and emits
+# actions only for inputs that differ (including unchecking wrong boxes and
+# overwriting wrong text), so a re-run on a filled page touches nothing.
+
+APPLY_JS = """
+var INPUT_QUERY = "%s";
+var actions = JSON.parse(arguments[0]);
+var rows = document.querySelectorAll("div[class*='gcb-question-row']");
+var report = {};
+
+function fire(el, type) {
+    el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+
+function isChecked(el) {
+    return el.tagName === 'INPUT' ? el.checked : el.getAttribute('aria-checked') === 'true';
+}
+
+actions.forEach(function (action) {
+    var entry = report[action.number] = report[action.number] || {applied: 0, errors: []};
+    try {
+        var row = rows[action.row - 1];
+        if (!row) throw new Error('row ' + action.row + ' not found');
+        var el = row.querySelectorAll(INPUT_QUERY)[action.input];
+        if (!el) throw new Error('input ' + action.input + ' not found');
+        if (el.disabled) throw new Error('input ' + action.input + ' is disabled');
+        if (action.op === 'set_text') {
+            var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, action.value);
+            fire(el, 'input');
+            fire(el, 'change');
+            if (el.value !== action.value) throw new Error('text value did not stick');
+        } else if (action.op === 'check' || action.op === 'uncheck') {
+            var want = action.op === 'check';
+            // click() fires click/input/change like a user would and also covers role=radio/checkbox widgets
+            if (isChecked(el) !== want) el.click();
+            if (isChecked(el) !== want) throw new Error('input ' + action.input + ' did not ' + action.op);
+        } else if (action.op === 'select') {
+            el.selectedIndex = action.value;
+            fire(el, 'input');
+            fire(el, 'change');
+            if (el.selectedIndex !== action.value) throw new Error('option did not stick');
+        } else {
+            throw new Error('unknown op ' + action.op);
+        }
+        entry.applied++;
+    } catch (e) {
+        entry.errors.push(String(e.message || e));
+    }
+});
+return JSON.stringify(report);
+""" % INPUT_QUERY
+
+
+def _action(number, row, record, op, value=None):
+    return {"number": number, "row": row["index"], "input": record["ordinal"], "op": op, "value": value}
+
+
+def _plan(status, message, actions=None):
+    return {"status": status, "message": message, "actions": actions or []}
+
+
+def parse_matching_answer(answer):
+    # Parse answer format: "1-B, 2-C, 3-A, 4-D"
+    return dict(re.findall(r"(\d+)-([A-D])", answer))
+
+
+def _radio_groups(inputs):
+    groups = {}
+    for record in inputs:
+        if record["kind"] == "radio" and record["name"]:
+            groups.setdefault(record["name"], []).append(record)
+    return groups
+
+
+def plan_text(number, row, answer):
+    records = [r for r in row["inputs"] if r["kind"] == "text"]
+    if not records:
+        return _plan("skip", "No text input found")
+    current = (records[0].get("value") or "").strip()
+    if current == answer.strip():
+        return _plan("already", f"Text input already filled with '{current}'")
+    message = f"Replaced '{current}' with '{answer}'" if current else f"Filled text input with '{answer}'"
+    return _plan("fill", message, [_action(number, row, records[0], "set_text", answer)])
+
+
+def plan_single_choice(number, row, answer):
+    records = [r for r in row["inputs"] if r["kind"] == "radio"]
+    if not records:
+        return _plan("skip", "No radio buttons found")
+    answer = answer.strip().lower()
+    for record in records:
+        label = (record.get("label") or "").strip().lower()
+        if label == answer or (answer == "true" and label in ["true", "yes"]) or (answer == "false" and label in ["false", "no"]):
+            if record.get("checked"):
+                return _plan("already", f"Radio '{label}' already selected")
+            # Checking the target radio clears whichever one was wrongly selected
+            return _plan("fill", f"Selected radio '{label}' for answer '{answer}'",
+                         [_action(number, row, record, "check")])
+    return _plan("skip", f"No matching radio found for answer '{answer}'")
+
+
+def _match_checkboxes(records, answer_parts):
+    # Each answer part picks the boxes whose label equals it; only a part with no
+    # exact match falls back to a substring match, and only if that match is
+    # unique. Returns (indexes of wanted boxes, whether every part resolved).
+    wanted, resolved = set(), True
+    for part in answer_parts:
+        part = part.lower()
+        exact = [i for i, r in enumerate(records) if (r.get("label") or "").strip().lower() == part]
+        partial = [i for i, r in enumerate(records) if part in (r.get("label") or "").strip().lower()]
+        if exact:
+            wanted.update(exact)
+        elif len(partial) == 1:
+            wanted.update(partial)
+        else:
+            resolved = False
+    return wanted, resolved
+
+
+def plan_multi_choice(number, row, answer):
+    records = [r for r in row["inputs"] if r["kind"] == "checkbox"]
+    if not records:
+        return _plan("skip", "No checkboxes found")
+    answer_parts = [part.strip() for part in answer.split(",") if part.strip()]
+    wanted, resolved = _match_checkboxes(records, answer_parts)
+    if not wanted:
+        return _plan("skip", f"No matching checkboxes found for answer '{answer}'")
+    actions, labels = [], []
+    for idx, record in enumerate(records):
+        checked = bool(record.get("checked"))
+        if idx in wanted:
+            labels.append((record.get("label") or "").strip())
+            if not checked:
+                actions.append(_action(number, row, record, "check"))
+        elif checked and resolved:
+            # Wrong boxes are only cleared when every answer part matched a box
+            actions.append(_action(number, row, record, "uncheck"))
+    if not actions:
+        return _plan("already", "Checkboxes already match the answer")
+    unchecked = sum(1 for action in actions if action["op"] == "uncheck")
+    suffix = f" (unchecked {unchecked} wrong)" if unchecked else ""
+    return _plan("fill", f"Selected checkboxes {labels} for answer '{answer}'{suffix}", actions)
+
+
+def plan_dropdown_matching(number, row, answer):
+    answer_pairs = parse_matching_answer(answer)
+    if not answer_pairs:
+        return _plan("skip", f"Invalid matching answer format: '{answer}'")
+    selects = [r for r in row["inputs"] if r["kind"] == "select"]
+    actions, chosen = [], []
+    for sub_idx, record in enumerate(selects, 1):
+        answer_value = answer_pairs.get(str(sub_idx))
+        if answer_value is None:
+            continue
+        for option_idx, option in enumerate(record.get("options") or []):
+            if option["text"].lower() == answer_value.lower():
+                chosen.append(f"{sub_idx}-{option['text']}")
+                if not option.get("selected"):
+                    actions.append(_action(number, row, record, "select", option_idx))
+                break
+    if not chosen:
+        return _plan("skip", f"No matching dropdown options found for answer '{answer}'")
+    if not actions:
+        return _plan("already", "All dropdowns already selected")
+    return _plan("fill", f"Selected dropdown options {chosen}", actions)
+
+
+def plan_radio_grid_matching(number, row, answer):
+    answer_pairs = parse_matching_answer(answer)
+    if not answer_pairs:
+        return _plan("skip", f"Invalid matching answer format: '{answer}'")
+    groups = _radio_groups(row["inputs"])
+    actions, chosen = [], []
+    for sub_idx, group in enumerate(groups.values(), 1):
+        answer_value = answer_pairs.get(str(sub_idx))
+        if answer_value is None:
+            continue
+        for record in group:
+            if (record.get("label") or "").strip().lower() == answer_value.lower():
+                chosen.append(f"{sub_idx}-{record['label']}")
+                if not record.get("checked"):
+                    actions.append(_action(number, row, record, "check"))
+                break
+    if not chosen:
+        return _plan("skip", f"No matching radio options found for answer '{answer}'")
+    if not actions:
+        return _plan("already", "All radio groups already selected")
+    return _plan("fill", f"Selected radios {chosen}", actions)
+
+
+PLANNERS = {
+    classifier.TEXT: plan_text,
+    classifier.SINGLE_CHOICE: plan_single_choice,
+    classifier.MULTI_CHOICE: plan_multi_choice,
+    classifier.DROPDOWN_MATCHING: plan_dropdown_matching,
+    classifier.RADIO_GRID_MATCHING: plan_radio_grid_matching,
+}
+
+
+def plan_question(number, row, kind, answer):
+    planner = PLANNERS.get(kind)
+    if not planner:
+        return _plan("skip", f"No input type matched ({kind})")
+    return planner(number, row, answer)
+
+
+def apply_plan(driver, actions):
+    # One round trip for the whole plan; returns {question id: {"applied", "errors"}}
+    if not actions:
+        return {}
+    return json.loads(driver.execute_script(APPLY_JS, json.dumps(actions)) or "{}")
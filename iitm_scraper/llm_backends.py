@@ -0,0 +1,78 @@
+import os
+import json
+import logging
+import threading
+import urllib.request
+
+# --- LLM backends ---
+# The solve stage talks to a backend through generate(prompt,
+# max_output_tokens), which yields the reply as streamed text chunks.
+# "gemini" calls the Gemini API; "stub" calls the local stand-in server in
+# llm_stub_server.py so solve and fill can run and be benchmarked offline.
+
+GEMINI_MODEL = "gemini-1.5-flash"
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+LLM_STUB_URL = os.getenv("LLM_STUB_URL", "http://127.0.0.1:8765")
+
+
+class GeminiBackend:
+    name = "gemini"
+
+    def __init__(self, model_name=GEMINI_MODEL, temperature=0.7):
+        self.model_name = model_name
+        self.temperature = temperature
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _client(self):
+        # Configured on first use so fully cached runs never import or touch the API client
+        with self._lock:
+            if self._model is None:
+                import google.generativeai as genai
+                genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+                self._model = genai.GenerativeModel(self.model_name)
+                logging.info("Initialized Gemini client")
+            return self._model
+
+    def generate(self, prompt, max_output_tokens):
+        response = self._client().generate_content(
+            prompt,
+            generation_config={
+                "max_output_tokens": max_output_tokens,
+                "temperature": self.temperature
+            },
+            stream=True
+        )
+        for chunk in response:
+            yield chunk.text
+
+
+class StubBackend:
+    name = "stub"
+
+    def __init__(self, url=LLM_STUB_URL, timeout=60):
+        self.url = url.rstrip("/")
+        self.model_name = f"stub@{self.url}"
+        self.timeout = timeout
+
+    def generate(self, prompt, max_output_tokens):
+        body = json.dumps({"prompt": prompt, "max_output_tokens": max_output_tokens}).encode("utf-8")
+        request = urllib.request.Request(f"{self.url}/generate", data=body,
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            # The stub streams one answer per line; pass lines on as they arrive
+            for line in response:
+                yield line.decode("utf-8")
+
+
+BACKENDS = {
+    GeminiBackend.name: GeminiBackend,
+    StubBackend.name: StubBackend,
+}
+
+
+def create_backend(name=None):
+    name = (name or LLM_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend '{name}' (choose from: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
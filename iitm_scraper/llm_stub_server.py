@@ -0,0 +1,109 @@
+import re
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from .answer_cache import normalize_question
+
+# --- Local LLM stand-in ---
+# A tiny HTTP server that answers the solver's prompts without network
+# access. Answers come from a recorded file (question text -> answer) when
+# available, otherwise they are derived deterministically from the question
+# text. Latency can be injected before the first line and between lines to
+# mimic a real model while load-testing the solve and fill stages.
+#
+#   python -m iitm_scraper.llm_stub_server --port 8765 --answers recorded.json --latency 1.5 --per-answer 0.2
+#   LLM_BACKEND=stub python -m iitm_scraper
+
+QUESTION_BLOCK = re.compile(r"^\[(Q\d+)\]\n(.*?)(?=\n\n---|\Z)", re.MULTILINE | re.DOTALL)
+CHOICES = ["A", "B", "C", "D"]
+
+
+def load_recorded_answers(path):
+    # Accepts {"question text": "answer"} or a list of {"raw_text"/"question", "answer"} records
+    if not path:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        items = data.items()
+    else:
+        items = ((item.get("raw_text") or item.get("question"), item["answer"]) for item in data)
+    return {normalize_question(question): answer for question, answer in items if question}
+
+
+def deterministic_answer(question):
+    digest = hashlib.sha256(normalize_question(question).encode("utf-8")).digest()
+    return CHOICES[digest[0] % len(CHOICES)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    recorded = {}
+    latency = 0.0
+    per_answer = 0.0
+    jitter = 0.0
+
+    def _delay(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds + random.uniform(0, self.jitter))
+
+    def do_POST(self):
+        if self.path != "/generate":
+            self.send_error(404)
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        blocks = QUESTION_BLOCK.findall(payload.get("prompt", ""))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.end_headers()
+        self._delay(self.latency)
+        for number, question in blocks:
+            answer = self.recorded.get(normalize_question(question)) or deterministic_answer(question)
+            self.wfile.write(f"{number}) {answer}\n".encode("utf-8"))
+            self.wfile.flush()
+            self._delay(self.per_answer)
+        logging.info(f"Stub answered {len(blocks)} questions")
+
+    def log_message(self, format, *args):
+        logging.debug(f"{self.address_string()} - {format % args}")
+
+
+def serve(host="127.0.0.1", port=8765, answers=None, latency=0.0, per_answer=0.0, jitter=0.0):
+    handler = type("ConfiguredStubHandler", (StubHandler,), {
+        "recorded": load_recorded_answers(answers),
+        "latency": latency,
+        "per_answer": per_answer,
+        "jitter": jitter,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"🤖 Stub LLM listening on http://{host}:{server.server_address[1]} "
+          f"({len(handler.recorded)} recorded answers, latency {latency}s + {per_answer}s/answer)")
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve deterministic or recorded answers in place of Gemini.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--answers", help="JSON file of recorded answers keyed by question text")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before the first answer line")
+    parser.add_argument("--per-answer", type=float, default=0.0, help="seconds between answer lines")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay of up to this many seconds")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.answers, args.latency, args.per_answer, args.jitter)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("🛑 Stub LLM stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import os
+import json
+import time
+import logging
+import threading
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from .run_report import span
+
+# --- Locator registry ---
+# Each logical page target (practice link, check button, question row) has
+# several candidate selectors. Instead of trying them one after another,
+# each behind its own 30 s wait, every poll checks all of them in one
+# script and the first match wins. Wins are counted per selector and kept
+# across runs (saved once per run), so the usual winner is checked first.
+
+LOCATOR_STATS_PATH = os.getenv("LOCATOR_STATS_PATH", "locator_stats.json")
+
+# target -> [(selector name, "xpath" | "css selector", template)]; templates
+# are formatted with the keyword arguments given to race()
+LOCATORS = {
+    "practice_link": [
+        ("any_practice", "xpath",
+         "//div[contains(@class, 'units__subitems') and contains(.//span, 'Practice Assignment')]"),
+        ("practice_dash_week", "xpath",
+         "//div[contains(@class, 'units__subitems') and contains(.//span, 'Practice Assignment - {week}')]"),
+        ("practice_space_week", "xpath",
+         "//div[contains(@class, 'units__subitems') and contains(.//span, 'Practice Assignment {week}')]"),
+    ],
+    "check_button": [
+        ("check_button", "xpath",
+         "//button[contains(., 'Check Answers') or contains(., 'check answers') or contains(., 'Check') or contains(., 'check')]"),
+        # Fallback to Submit if Check Answers not found
+        ("submit_button", "xpath", "//button[contains(., 'Submit') or contains(., 'submit')]"),
+        ("submit_input", "xpath",
+         "//input[@type='submit' and (contains(@value, 'Check') or contains(@value, 'check') "
+         "or contains(@value, 'Submit') or contains(@value, 'submit'))]"),
+    ],
+    "question_row": [
+        # The extraction and fill scripts read gcb-question-row rows, so this
+        # target has no looser fallback
+        ("gcb_row", "xpath", "//div[contains(@class, 'gcb-question-row')]"),
+    ],
+}
+
+# Returns [index, element] for the first candidate (in the given order) with
+# a matching element, or null. "Clickable" mirrors EC.element_to_be_clickable:
+# rendered and not disabled.
+RACE_SCRIPT = """/* locator_race */
+const [candidates, clickable] = arguments;
+for (let i = 0; i < candidates.length; i++) {
+  const [kind, value] = candidates[i];
+  let nodes;
+  if (kind === 'xpath') {
+    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    nodes = Array.from({length: result.snapshotLength}, (_, j) => result.snapshotItem(j));
+  } else {
+    nodes = Array.from(document.querySelectorAll(value));
+  }
+  for (const el of nodes) {
+    if (!clickable || (el.getClientRects().length > 0 && !el.disabled)) return [i, el];
+  }
+}
+return null;
+"""
+
+
+class LocatorStats:
+    # {target: {selector name: {"wins", "last_win"}}}; wins are counted in
+    # memory and written by save() at the end of a run
+    def __init__(self, path=LOCATOR_STATS_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self._dirty = False
+        self.stats = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable locator stats {self.path}: {e}")
+            return {}
+
+    def wins(self, target, name):
+        return self.stats.get(target, {}).get(name, {}).get("wins", 0)
+
+    def order(self, target, candidates):
+        # Most wins first; ties keep the registry order
+        return sorted(candidates, key=lambda candidate: -self.wins(target, candidate[0]))
+
+    def record_win(self, target, name):
+        with self.lock:
+            entry = self.stats.setdefault(target, {}).setdefault(name, {"wins": 0})
+            entry["wins"] += 1
+            entry["last_win"] = time.time()
+            self._dirty = True
+
+    def save(self):
+        with self.lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.stats, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+_stats = None
+
+
+def stats():
+    global _stats
+    if _stats is None:
+        _stats = LocatorStats()
+    return _stats
+
+
+def save_stats():
+    # Writes this run's wins, if any locator was raced
+    if _stats is not None:
+        _stats.save()
+
+
+def race(driver, target, timeout=30, clickable=True, **params):
+    # Polls every candidate selector of target in one wait and returns
+    # (element, selector name) for the first match. Raises TimeoutException
+    # naming all candidates when none matches within timeout.
+    ordered = stats().order(target, LOCATORS[target])
+    script_args = [[kind, template.format(**params)] for _, kind, template in ordered]
+    with span("locate", target=target) as located:
+        try:
+            index, element = WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script(RACE_SCRIPT, script_args, clickable)
+            )
+        except TimeoutException:
+            names = [name for name, _, _ in ordered]
+            located.outcome = "timeout"
+            logging.warning(f"No {target} locator matched within {timeout}s: {names}")
+            raise TimeoutException(f"No {target} locator matched within {timeout}s (tried {names})")
+        name = ordered[index][0]
+        located.set(selector=name)
+    stats().record_win(target, name)
+    logging.info(f"Located {target} with '{name}' in {located.duration:.2f}s")
+    return element, name
@@ -0,0 +1,100 @@
+import os
+import gzip
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+from . import run_report
+
+# --- Logging pipeline ---
+# Callers only format and enqueue records; a QueueListener thread does all
+# file I/O, rotating scraper.log by size and gzipping old files. Verbosity
+# can be raised or lowered per stage: the stage is the innermost run report
+# span open on the logging thread that has a level configured, e.g.
+#   LOG_LEVEL=INFO LOG_STAGE_LEVELS="scrape=DEBUG,fill=WARNING"
+# Records below the stage's level are dropped before they are formatted.
+
+LOG_PATH = os.getenv("LOG_PATH", "scraper.log")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_STAGE_LEVELS = os.getenv("LOG_STAGE_LEVELS", "")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+LOG_BACKUPS = int(os.getenv("LOG_BACKUPS", "5"))
+LOG_FORMAT = "%(asctime)s - %(levelname)s - [%(stage)s] %(message)s"
+
+_stage_filter = None
+
+
+def parse_level(value):
+    level = logging.getLevelName(str(value).strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {value}")
+    return level
+
+
+def parse_stage_levels(spec):
+    # "scrape=DEBUG,fill=WARNING" -> {"scrape": 10, "fill": 30}
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        stage, _, level = item.partition("=")
+        levels[stage.strip()] = parse_level(level)
+    return levels
+
+
+class StageLevelFilter(logging.Filter):
+    def __init__(self, default_level, stage_levels):
+        super().__init__()
+        self.default_level = default_level
+        self.stage_levels = stage_levels
+
+    def level_for(self, spans):
+        for span in reversed(spans):
+            level = self.stage_levels.get(span.name)
+            if level is not None:
+                return level
+        return self.default_level
+
+    def filter(self, record):
+        spans = run_report.current_spans()
+        record.stage = spans[-1].name if spans else "-"
+        return record.levelno >= self.level_for(spans)
+
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def setup_logging(path=LOG_PATH, level=LOG_LEVEL, stage_levels=LOG_STAGE_LEVELS,
+                  max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+    global _stage_filter
+    default_level = parse_level(level)
+    per_stage = parse_stage_levels(stage_levels) if isinstance(stage_levels, str) else dict(stage_levels)
+
+    file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+    file_handler.namer = lambda name: f"{name}.gz"
+    file_handler.rotator = _gzip_rotator
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    _stage_filter = StageLevelFilter(default_level, per_stage)
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(_stage_filter)
+    listener = logging.handlers.QueueListener(queue_handler.queue, file_handler)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    # The logger level is the cheapest gate, so it only lets through what some stage wants
+    root.setLevel(min([default_level, *per_stage.values()]))
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def enabled(level):
+    # Stage-aware check for messages that are expensive to build (DOM dumps etc.)
+    if _stage_filter is None:
+        return logging.getLogger().isEnabledFor(level)
+    return level >= _stage_filter.level_for(run_report.current_spans())
@@ -0,0 +1,155 @@
+import re
+import logging
+from lxml import html as lxml_html
+from .extraction import questions_from_snapshot
+
+# --- Offline question extraction ---
+# Parses saved portal HTML (the persisted page_source artifact or any saved
+# practice page) into the same snapshot records extraction.SNAPSHOT_JS returns from a live browser,
+# so the solve stage can be re-run without Chrome.
+
+ROW_XPATH = "//div[contains(@class, 'gcb-question-row')]"
+BODY_XPATH = ".//div[contains(@class, 'qt-embedded')]"
+INPUT_XPATH = ".//input | .//textarea | .//select | .//*[@role='radio'] | .//*[@role='checkbox']"
+
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "tbody", "thead", "tfoot", "tr", "ul",
+}
+SKIP_TAGS = {"script", "style", "noscript", "template", "head"}
+NON_TEXT_INPUT_TYPES = {"hidden", "submit", "button", "reset", "image", "file"}
+
+
+def _is_hidden(el):
+    if el.get("hidden") is not None or el.get("aria-hidden") == "true":
+        return True
+    style = (el.get("style") or "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def _collect_text(el, parts):
+    if not isinstance(el.tag, str) or el.tag in SKIP_TAGS or _is_hidden(el):
+        return
+    block = el.tag in BLOCK_TAGS
+    if block:
+        parts.append("\n")
+    if el.tag == "br":
+        parts.append("\n")
+    if el.text:
+        parts.append(el.text)
+    for child in el:
+        _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+    if block or el.tag == "td":
+        parts.append("\n" if block else "\t")
+
+
+def inner_text(el):
+    # Approximates the browser's innerText (what Selenium's .text returns):
+    # hidden and script content is dropped, block elements start new lines.
+    parts = []
+    _collect_text(el, parts)
+    lines = (re.sub(r"[ \t\r\f\v\u00a0]+", " ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _label_for(row, el):
+    el_id = el.get("id")
+    if el_id:
+        matches = row.xpath(".//label[@for=$id]", id=el_id)
+        if matches:
+            return inner_text(matches[0])
+    parent = el.getparent()
+    if parent is not None and parent.tag == "label":
+        return inner_text(parent)
+    sibling = el.getnext()
+    while sibling is not None and sibling.tag != "label":
+        sibling = sibling.getnext()
+    if sibling is not None:
+        return inner_text(sibling)
+    return (el.get("aria-label") or inner_text(el)).strip()
+
+
+def _kind_of(el):
+    if el.tag == "select":
+        return "select"
+    if el.tag == "textarea":
+        return "text"
+    if el.tag == "input":
+        input_type = (el.get("type") or "text").lower()
+        if input_type in ("radio", "checkbox"):
+            return input_type
+        if input_type in NON_TEXT_INPUT_TYPES:
+            return None
+        return "text"
+    role = el.get("role")
+    if role in ("radio", "checkbox"):
+        return role
+    return None
+
+
+def _input_record(row, el, kind, ordinal):
+    record = {"kind": kind, "ordinal": ordinal, "name": el.get("name") or "", "id": el.get("id") or ""}
+    if kind == "select":
+        options = [
+            {"text": inner_text(opt), "value": opt.get("value", inner_text(opt)),
+             "selected": opt.get("selected") is not None}
+            for opt in el.xpath(".//option")
+        ]
+        selected = [opt for opt in options if opt["selected"]] or options[:1]
+        record["value"] = selected[0]["value"] if selected else ""
+        record["options"] = options
+    elif kind in ("radio", "checkbox"):
+        record["label"] = _label_for(row, el)
+        record["value"] = el.get("value", "on" if el.tag == "input" else "")
+        if el.tag == "input":
+            record["checked"] = el.get("checked") is not None
+        else:
+            record["checked"] = el.get("aria-checked") == "true"
+    elif el.tag == "textarea":
+        record["value"] = el.text or ""
+    else:
+        record["value"] = el.get("value", "")
+    return record
+
+
+def snapshot_from_html(source):
+    tree = lxml_html.fromstring(source)
+    snapshot = []
+    for i, row in enumerate(tree.xpath(ROW_XPATH), 1):
+        body = row.xpath(BODY_XPATH)
+        kinds, labels, inputs = [], [], []
+        for ordinal, el in enumerate(row.xpath(INPUT_XPATH)):
+            kind = _kind_of(el)
+            if not kind:
+                continue
+            if kind not in kinds:
+                kinds.append(kind)
+            record = _input_record(row, el, kind, ordinal)
+            if "label" in record:
+                labels.append(record["label"])
+            inputs.append(record)
+        snapshot.append({
+            "index": i,
+            "text": inner_text(body[0]) if body else None,
+            "outer_html": lxml_html.tostring(row, encoding="unicode", with_tail=False),
+            "input_kinds": kinds,
+            "option_labels": labels,
+            "inputs": inputs,
+        })
+    return snapshot
+
+
+def load_snapshot_from_html(path):
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    snapshot = snapshot_from_html(source)
+    logging.info(f"Parsed {len(snapshot)} question rows from {path}")
+    return snapshot
+
+
+def load_questions_from_html(path):
+    return questions_from_snapshot(load_snapshot_from_html(path))
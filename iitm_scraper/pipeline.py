@@ -0,0 +1,152 @@
+import time
+import queue
+import logging
+import threading
+from . import artifacts
+from . import llm_backends
+from . import run_report
+from .answer_cache import AnswerCache
+from .solver import solve_in_batches
+from .run_report import span, timed
+
+# --- Solve stage ---
+# Everything between extracted questions and answers: the answer cache, the
+# LLM backend and the streaming solver thread. Shared by the live browser
+# run and the offline --from-html mode, and free of Selenium imports so the
+# offline commands start quickly.
+
+# Bump PROMPT_VERSION whenever the prompt changes so cached answers are not reused
+PROMPT_VERSION = "2"
+MISSING_ANSWER = "Answer: Not found"
+
+
+def save_questions(questions):
+    # Questions are handed to the solver in memory; the text form is kept as the 'questions' artifact
+    artifacts.put("questions", "".join(f"{q['raw_text']}\n\n---\n" for q in questions))
+    logging.info(f"Extracted {len(questions)} questions")
+    print(f"✅ {len(questions)} questions extracted.")
+
+
+# ==== PART 2: Get answers from the LLM backend (Gemini by default) ====
+def generate_answers(backend, batch, on_answer=None):
+    # Solve the batch in token-budgeted chunks sent concurrently; answers are
+    # streamed, matched back to questions by id, and unanswered ids get the fallback
+    try:
+        solved = solve_in_batches(batch, backend.generate, on_answer=on_answer)
+        logging.info(f"Successfully generated {len(solved)}/{len(batch)} answers with {backend.model_name}")
+    except Exception as e:
+        logging.error(f"Error calling {backend.name} backend: {e}")
+        print(f"❌ Error calling {backend.name} backend: {e}")
+        if backend.name == "gemini":
+            print("Ensure GEMINI_API_KEY is valid in .env")
+        else:
+            print(f"Ensure the stub server is running at {llm_backends.LLM_STUB_URL} (python -m iitm_scraper.llm_stub_server)")
+        raise
+
+    # The fallback only fills the answers artifact; it is never streamed to
+    # on_answer, so the fill stage leaves whatever is on the page untouched
+    answers = []
+    for q in batch:
+        if q["number"] not in solved:
+            logging.warning(f"Missing answer for {q['number']}, using fallback")
+        answers.append(solved.get(q["number"], MISSING_ANSWER))
+    return answers
+
+
+@timed("solve")
+def solve_questions(questions, backend_name=None, on_answer=None, known=None):
+    # known: answers already parsed by an interrupted run ({question number: answer}, see checkpoints.py)
+    backend = llm_backends.create_backend(backend_name or llm_backends.LLM_BACKEND)
+    print(f"\n🧠 Generating answers using the {backend.name} backend ({backend.model_name})...")
+    answers = [None] * len(questions)
+    known = known or {}
+    cache = AnswerCache()
+    try:
+        # Only cache misses go to the backend; a fully cached week makes no API calls
+        misses = []
+        with span("cache_lookup", questions=len(questions)) as lookup:
+            for idx, q in enumerate(questions):
+                answers[idx] = known.get(q["number"]) or cache.get(q["raw_text"], backend.model_name, PROMPT_VERSION)
+                if answers[idx] is None:
+                    misses.append(idx)
+                elif on_answer:
+                    on_answer(q["number"], answers[idx])
+            resumed = sum(1 for q in questions if q["number"] in known)
+            lookup.set(hits=len(questions) - len(misses), misses=len(misses), resumed=resumed)
+        if resumed:
+            print(f"♻️ {resumed} answers resumed from the checkpoint")
+        print(f"💾 Answer cache: {len(questions) - len(misses) - resumed} hits, {len(misses)} misses")
+        logging.info(f"Answer cache: {len(questions) - len(misses) - resumed} hits, {len(misses)} misses")
+
+        if misses:
+            generated = generate_answers(backend, [questions[idx] for idx in misses], on_answer)
+            for idx, answer in zip(misses, generated):
+                answers[idx] = answer
+                if answer != MISSING_ANSWER:
+                    cache.put(questions[idx]["raw_text"], backend.model_name, PROMPT_VERSION, answer)
+    finally:
+        cache.close()
+
+    artifacts.put("answers", "".join(f"{i}) {answer}\n" for i, answer in enumerate(answers, 1)))
+    logging.info(f"Generated {len(answers)} answers")
+    print(f"🎉 {len(answers)} answers generated.")
+    return answers
+
+
+def start_solver(questions, backend_name=None, known=None, on_answer=None):
+    # Runs the solve stage on a background thread and queues each answer as
+    # soon as it is parsed; None marks the end of the stream. on_answer also
+    # sees every answer (the checkpoint records them as they arrive).
+    answer_queue = queue.Queue()
+    outcome = {}
+    store = artifacts.active()
+
+    def emit(number, answer):
+        if on_answer:
+            on_answer(number, answer)
+        answer_queue.put((number, answer))
+
+    def run():
+        artifacts.bind(store)
+        try:
+            outcome["answers"] = solve_questions(questions, backend_name, on_answer=emit, known=known)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            answer_queue.put(None)
+
+    thread = threading.Thread(target=run, name="solver", daemon=True)
+    thread.start()
+    return answer_queue, thread, outcome
+
+
+# --- Offline mode: extract questions from saved page HTML ---
+def run_from_html(path, solve=True, backend_name=None,
+                  report_path=run_report.RUN_REPORT_PATH, prom_path=run_report.RUN_REPORT_PROM_PATH):
+    # path is a saved HTML file, or "latest" for the most recently persisted page_source artifact
+    from .offline_parser import load_questions_from_html, snapshot_from_html
+    from .extraction import questions_from_snapshot
+    print(f"📄 Extracting questions from saved page '{path}' (no browser)...")
+    report = run_report.start_run(mode="offline", backend=backend_name or llm_backends.LLM_BACKEND)
+    artifacts.start_run(f"{time.strftime('%Y%m%d-%H%M%S')}-offline", mode="offline", source=path)
+    try:
+        with span("scrape", source=path) as scrape:
+            if path == "latest":
+                try:
+                    source = artifacts.active().load("latest", "page_source").decode("utf-8")
+                except KeyError:
+                    scrape.outcome = "error"
+                    scrape.set(error="no persisted page_source artifact")
+                    logging.error("No persisted page_source artifact for --from-html latest")
+                    print("❌ No saved page source found. Pass the path of a saved HTML file, or do one "
+                          "live run with ARTIFACTS_PERSIST=1 so 'latest' has a page to read.")
+                    raise SystemExit(1)
+                questions = questions_from_snapshot(snapshot_from_html(source))
+            else:
+                questions = load_questions_from_html(path)
+        save_questions(questions)
+        if solve and questions:
+            solve_questions(questions, backend_name)
+    finally:
+        report.save(report_path, prom_path)
+    return questions
@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import logging
+import argparse
+import threading
+
+# --- Practice Assignment route cache ---
+# Remembers the resolved Practice Assignment URL per (subject, week) after
+# the first successful click-through, so later runs can load it directly
+# instead of walking dashboard -> course -> Week N -> Practice Assignment.
+# The browser falls back to the click path (and drops the entry) when the
+# deep link misses or redirects.
+
+ROUTE_CACHE_PATH = os.getenv("ROUTE_CACHE_PATH", "route_cache.json")
+ROUTE_CACHE_ENABLED = os.getenv("ROUTE_CACHE", "1").lower() in ("1", "true", "yes")
+
+
+def route_key(subject_id, week):
+    return f"{subject_id}/week-{week}"
+
+
+class RouteCache:
+    def __init__(self, path=ROUTE_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def entries(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable route cache {self.path}: {e}")
+            return {}
+
+    def _write(self, entries):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def get(self, subject_id, week):
+        entry = self.entries().get(route_key(subject_id, week))
+        return entry["url"] if entry else None
+
+    def put(self, subject_id, week, url):
+        with self.lock:
+            entries = self.entries()
+            entry = entries.get(route_key(subject_id, week), {})
+            entries[route_key(subject_id, week)] = {
+                "url": url,
+                "saved_at": time.time(),
+                "hits": entry.get("hits", 0) if entry.get("url") == url else 0,
+            }
+            self._write(entries)
+        logging.info(f"Cached route for {subject_id} week {week}: {url}")
+
+    def hit(self, subject_id, week):
+        with self.lock:
+            entries = self.entries()
+            entry = entries.get(route_key(subject_id, week))
+            if entry:
+                entry["hits"] = entry.get("hits", 0) + 1
+                entry["last_used"] = time.time()
+                self._write(entries)
+
+    def forget(self, subject_id=None, week=None):
+        # Drops one route, every route of a subject, or (no arguments) all of them
+        with self.lock:
+            entries = self.entries()
+            if subject_id is None:
+                removed = list(entries)
+            elif week is None:
+                removed = [key for key in entries if key.startswith(f"{subject_id}/")]
+            else:
+                removed = [key for key in [route_key(subject_id, week)] if key in entries]
+            for key in removed:
+                del entries[key]
+            self._write(entries)
+        return len(removed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the cached Practice Assignment URLs.")
+    parser.add_argument("--path", default=ROUTE_CACHE_PATH, help=f"route cache file (default: {ROUTE_CACHE_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="show every cached route")
+    forget_cmd = commands.add_parser("forget", help="drop cached routes (all of them unless filtered)")
+    forget_cmd.add_argument("--subject", help="only routes of this subject id")
+    forget_cmd.add_argument("--week", type=int, help="only this week (needs --subject)")
+    args = parser.parse_args()
+
+    cache = RouteCache(args.path)
+    if args.command == "list":
+        for key, entry in sorted(cache.entries().items()):
+            saved = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["saved_at"]))
+            print(f"{key:<28} hits={entry.get('hits', 0):<4} saved={saved}  {entry['url']}")
+    elif args.command == "forget":
+        if args.week is not None and not args.subject:
+            parser.error("--week needs --subject")
+        removed = cache.forget(args.subject, args.week)
+        print(f"🧹 Removed {removed} cached routes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import os
+import json
+import time
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+
+# --- Run report ---
+# Structured timing spans for each step of a run (login, navigation, week
+# expansion, scraping, LLM calls, parsing, per-question fills, submission).
+# Each span records its duration, retry count and outcome. At the end of a
+# run the spans are written to a JSON report and, optionally, to a
+# Prometheus textfile for node_exporter's textfile collector.
+
+RUN_REPORT_PATH = os.getenv("RUN_REPORT_PATH", "run_report.json")
+RUN_REPORT_PROM_PATH = os.getenv("RUN_REPORT_PROM_PATH")
+METRIC_PREFIX = "aas"
+
+
+class Span:
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = dict(attrs)
+        self.retries = 0
+        self.outcome = None
+        self.started_at = time.time()
+        self.duration = 0.0
+
+    def retry(self):
+        self.retries += 1
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "started_at": round(self.started_at, 3),
+            "duration": round(self.duration, 4),
+            "retries": self.retries,
+            "outcome": self.outcome,
+            "attrs": self.attrs,
+        }
+
+
+class RunReport:
+    def __init__(self, **meta):
+        self.meta = meta
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.spans = []
+        self.extra = {}
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self):
+        stages = {}
+        for span in list(self.spans):
+            entry = stages.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0, "retries": 0, "outcomes": {}})
+            entry["count"] += 1
+            entry["total"] += span.duration
+            entry["max"] = max(entry["max"], span.duration)
+            entry["retries"] += span.retries
+            entry["outcomes"][span.outcome] = entry["outcomes"].get(span.outcome, 0) + 1
+        for entry in stages.values():
+            entry["total"] = round(entry["total"], 4)
+            entry["max"] = round(entry["max"], 4)
+        return stages
+
+    def to_dict(self):
+        return {
+            "meta": self.meta,
+            "started_at": round(self.started_at, 3),
+            "duration": round(time.perf_counter() - self._started, 4),
+            "summary": self.summary(),
+            "spans": [span.to_dict() for span in list(self.spans)],
+            **self.extra,
+        }
+
+    def write_json(self, path=RUN_REPORT_PATH):
+        data = self.to_dict()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+        logging.info(f"Run report saved to {path}")
+        return data
+
+    def write_prometheus(self, path):
+        data = self.to_dict()
+        labels = "".join(f',{key}="{value}"' for key, value in sorted(self.meta.items()) if value is not None)
+        lines = [
+            f"# HELP {METRIC_PREFIX}_run_duration_seconds Wall time of the last run.",
+            f"# TYPE {METRIC_PREFIX}_run_duration_seconds gauge",
+            f"{METRIC_PREFIX}_run_duration_seconds{{{labels.lstrip(',')}}} {data['duration']}",
+            f"# HELP {METRIC_PREFIX}_run_timestamp_seconds Start time of the last run.",
+            f"# TYPE {METRIC_PREFIX}_run_timestamp_seconds gauge",
+            f"{METRIC_PREFIX}_run_timestamp_seconds{{{labels.lstrip(',')}}} {data['started_at']}",
+            f"# HELP {METRIC_PREFIX}_stage_duration_seconds Total time spent in each stage in the last run.",
+            f"# TYPE {METRIC_PREFIX}_stage_duration_seconds gauge",
+        ]
+        for stage, entry in data["summary"].items():
+            lines.append(f'{METRIC_PREFIX}_stage_duration_seconds{{stage="{stage}"{labels}}} {entry["total"]}')
+        lines += [
+            f"# HELP {METRIC_PREFIX}_stage_retries Retries per stage in the last run.",
+            f"# TYPE {METRIC_PREFIX}_stage_retries gauge",
+        ]
+        for stage, entry in data["summary"].items():
+            lines.append(f'{METRIC_PREFIX}_stage_retries{{stage="{stage}"{labels}}} {entry["retries"]}')
+        lines += [
+            f"# HELP {METRIC_PREFIX}_stage_spans Spans per stage and outcome in the last run.",
+            f"# TYPE {METRIC_PREFIX}_stage_spans gauge",
+        ]
+        for stage, entry in data["summary"].items():
+            for outcome, count in entry["outcomes"].items():
+                lines.append(f'{METRIC_PREFIX}_stage_spans{{stage="{stage}",outcome="{outcome}"{labels}}} {count}')
+        # Write then rename so the textfile collector never reads a partial file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+        logging.info(f"Prometheus metrics saved to {path}")
+
+    def save(self, path=RUN_REPORT_PATH, prom_path=RUN_REPORT_PROM_PATH):
+        self.write_json(path)
+        if prom_path:
+            self.write_prometheus(prom_path)
+
+
+_active = RunReport()
+_local = threading.local()
+
+
+def start_run(**meta):
+    global _active
+    _active = RunReport(**meta)
+    return _active
+
+
+def active():
+    return _active
+
+
+def current_spans():
+    # Spans open on the calling thread, outermost first
+    return list(getattr(_local, "stack", ()))
+
+
+@contextmanager
+def span(name, **attrs):
+    current = Span(name, attrs)
+    stack = _local.__dict__.setdefault("stack", [])
+    stack.append(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.outcome = current.outcome or "error"
+        current.attrs.setdefault("error", str(e)[:300])
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        current.outcome = current.outcome or "ok"
+        stack.pop()
+        _active.add(current)
+
+
+def record(name, duration, outcome="ok", retries=0, **attrs):
+    current = Span(name, attrs)
+    current.started_at = time.time() - duration
+    current.duration = duration
+    current.outcome = outcome
+    current.retries = retries
+    _active.add(current)
+    return current
+
+
+def timed(name, **attrs):
+    # Decorator form of span() for stages that map onto one function
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, **attrs):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
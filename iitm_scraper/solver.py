@@ -0,0 +1,205 @@
+import os
+import re
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .run_report import span, record as record_span
+
+# --- Chunked, concurrent solving ---
+# Splits questions into token-budgeted batches, sends them to the model
+# through a bounded thread pool under a request rate limit, and merges the
+# replies back into per-question slots by question id (e.g. "Q3"), never by
+# line position.
+
+SOLVER_BATCH_TOKENS = int(os.getenv("SOLVER_BATCH_TOKENS", "3000"))
+SOLVER_MAX_BATCH_QUESTIONS = int(os.getenv("SOLVER_MAX_BATCH_QUESTIONS", "8"))
+SOLVER_MAX_IN_FLIGHT = int(os.getenv("SOLVER_MAX_IN_FLIGHT", "4"))
+SOLVER_REQUESTS_PER_MINUTE = float(os.getenv("SOLVER_REQUESTS_PER_MINUTE", "15"))
+ANSWER_TOKENS_PER_QUESTION = 64
+
+ANSWER_LINE = re.compile(r"^\W*(Q\d+)\s*[):.\-]\s*(.*)$", re.IGNORECASE)
+
+
+def estimate_tokens(text):
+    # Rough 4-characters-per-token estimate; only used for batch sizing
+    return max(1, len(text) // 4)
+
+
+def plan_batches(questions, token_budget=SOLVER_BATCH_TOKENS, max_questions=SOLVER_MAX_BATCH_QUESTIONS):
+    batches, current, used = [], [], 0
+    for q in questions:
+        cost = estimate_tokens(q["raw_text"]) + ANSWER_TOKENS_PER_QUESTION
+        if current and (used + cost > token_budget or len(current) >= max_questions):
+            batches.append(current)
+            current, used = [], 0
+        current.append(q)
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def max_output_tokens_for(batch):
+    return ANSWER_TOKENS_PER_QUESTION * len(batch) + 64
+
+
+def build_prompt(batch):
+    ids = ", ".join(q["number"] for q in batch)
+    questions_content = "".join(f"[{q['number']}]\n{q['raw_text']}\n\n---\n" for q in batch).strip()
+    return (
+        f"Generate exactly {len(batch)} answers for the following questions, one for each question id ({ids}). "
+        "Use the 'Accepted Answers' if provided in the question text. If no 'Accepted Answers' are provided, "
+        "generate the correct answer based on the question and options. "
+        f"Format each answer on a new line as: <question id>) <option/integer/comma-separated options>, "
+        f"for example: {batch[0]['number']}) <answer>, "
+        "with no additional text, explanations, or extra lines. Ensure multiselect answers are comma-separated.\n\n"
+        f"{questions_content}"
+    )
+
+
+class AnswerLineParser:
+    # Incremental parser for streamed replies: each answer is emitted as soon
+    # as its line is complete instead of after the whole response arrives.
+    def __init__(self, batch):
+        self.wanted = {q["number"].upper(): q["number"] for q in batch}
+        self.buffer = ""
+        self.answers = {}
+
+    def _parse_line(self, line):
+        match = ANSWER_LINE.match(line.strip())
+        if not match:
+            return None
+        number = self.wanted.get(match.group(1).upper())
+        answer = match.group(2).strip()
+        if not number or number in self.answers or not answer:
+            return None
+        self.answers[number] = answer
+        return number, answer
+
+    def feed(self, chunk):
+        self.buffer += chunk or ""
+        *complete, self.buffer = self.buffer.split("\n")
+        return [parsed for parsed in map(self._parse_line, complete) if parsed]
+
+    def close(self):
+        line, self.buffer = self.buffer, ""
+        parsed = self._parse_line(line)
+        return [parsed] if parsed else []
+
+
+def parse_answers(text, batch):
+    parser = AnswerLineParser(batch)
+    parser.feed(text)
+    parser.close()
+    return parser.answers
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute=SOLVER_REQUESTS_PER_MINUTE):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute and requests_per_minute > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_shared_limiter = None
+_shared_limiter_lock = threading.Lock()
+
+
+def shared_limiter():
+    # One limiter per process, so concurrent solves (tab pool) share the per-minute budget
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+
+def _solve_batch(batch, generate, limiter, on_answer, attempt=0):
+    limiter.acquire()
+    label = f"{batch[0]['number']}..{batch[-1]['number']}"
+    parser = AnswerLineParser(batch)
+    parse_time = 0.0
+    with span("llm_call", batch=label, questions=len(batch)) as call:
+        call.retries = attempt
+        result = generate(build_prompt(batch), max_output_tokens_for(batch))
+        # generate() may return the full text or an iterator of streamed chunks
+        chunks = [result] if isinstance(result, str) else result
+        try:
+            for chunk in chunks:
+                started = time.perf_counter()
+                parsed = parser.feed(chunk)
+                parse_time += time.perf_counter() - started
+                for number, answer in parsed:
+                    if on_answer:
+                        on_answer(number, answer)
+            started = time.perf_counter()
+            parsed = parser.close()
+            parse_time += time.perf_counter() - started
+            for number, answer in parsed:
+                if on_answer:
+                    on_answer(number, answer)
+        finally:
+            # Parsing is interleaved with the stream, so it is reported as its own summed span
+            record_span("parse", parse_time, batch=label, answers=len(parser.answers))
+        call.set(answers=len(parser.answers))
+        if len(parser.answers) < len(batch):
+            call.outcome = "partial"
+    logging.info(f"Solved batch {label}: {len(parser.answers)}/{len(batch)} answers in {call.duration:.2f}s")
+    return parser.answers
+
+
+def solve_in_batches(questions, generate, max_in_flight=SOLVER_MAX_IN_FLIGHT, limiter=None,
+                     token_budget=SOLVER_BATCH_TOKENS, max_questions=SOLVER_MAX_BATCH_QUESTIONS,
+                     on_answer=None):
+    # generate(prompt, max_output_tokens) -> response text or an iterator of
+    # text chunks. on_answer(id, answer) is called from worker threads as each
+    # answer is parsed. Returns {question id: answer}; ids the model never
+    # answered are retried once in their own batches and left out of the
+    # result if they are still missing.
+    limiter = limiter or shared_limiter()
+    solved, errors = {}, []
+    lock = threading.Lock()
+
+    def record(number, answer):
+        # Answers from a stream that later fails are kept, and a retried id is
+        # never reported twice
+        with lock:
+            if number in solved:
+                return
+            solved[number] = answer
+        if on_answer:
+            on_answer(number, answer)
+
+    pending = list(questions)
+    for attempt in range(2):
+        batches = plan_batches(pending, token_budget, max_questions)
+        if not batches:
+            break
+        with ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(batches)))) as pool:
+            futures = {pool.submit(_solve_batch, batch, generate, limiter, record, attempt): batch for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+                    logging.warning(f"Batch {batch[0]['number']}..{batch[-1]['number']} failed: {e}")
+        pending = [q for q in pending if q["number"] not in solved]
+        if pending and attempt == 0:
+            logging.warning(f"Retrying {len(pending)} unanswered questions: {[q['number'] for q in pending]}")
+            # Smaller batches on the retry so one bad reply cannot drop many slots again
+            max_questions = max(1, max_questions // 2)
+    if errors and not solved:
+        raise errors[0]
+    return solved
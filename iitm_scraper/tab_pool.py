@@ -0,0 +1,156 @@
+import time
+import queue
+import logging
+import threading
+import contextlib
+from . import browser
+from . import run_report
+from .run_report import span
+
+# --- Tab pool ---
+# Runs several practice assignments at once in the one signed-in browser.
+# Each pool tab has a worker thread that takes the next week and runs it
+# with browser.run_job. WebDriver talks to one tab at a time, so the workers
+# take turns on the driver: a turn switches to the worker's tab and holds
+# the driver for one stretch of page work (navigate and scrape, one fill
+# batch, submit). Waiting for the LLM happens outside a turn, on the
+# solver threads, so one tab's generation overlaps with another tab's page
+# work.
+#
+#   python -m iitm_scraper --subject "system commands" --weeks 1-8 --tabs 3
+
+DEFAULT_TABS = 3
+
+
+class Tab:
+    def __init__(self, index, handle):
+        self.index = index
+        self.handle = handle
+
+
+class TabPool:
+    def __init__(self, size=DEFAULT_TABS):
+        self.size = max(1, size)
+        self.tabs = []
+        self.lock = threading.Lock()
+        self.current = None
+        self.waited = 0.0
+
+    def open(self):
+        # The session's current tab is the first pool tab; the rest are opened next to it
+        driver = browser.driver
+        self.tabs = [Tab(1, driver.current_window_handle)]
+        for index in range(2, self.size + 1):
+            driver.switch_to.new_window("tab")
+            self.tabs.append(Tab(index, driver.current_window_handle))
+        self.current = self.tabs[-1].handle
+        print(f"🗂️ Tab pool ready with {len(self.tabs)} tabs")
+
+    def close(self):
+        # Keeps one tab open for the next run
+        driver = browser.driver
+        with self.lock:
+            for tab in self.tabs[1:]:
+                try:
+                    driver.switch_to.window(tab.handle)
+                    driver.close()
+                except Exception as e:
+                    logging.warning(f"Could not close pool tab {tab.index}: {e}")
+            if self.tabs:
+                driver.switch_to.window(self.tabs[0].handle)
+
+    @contextlib.contextmanager
+    def turn(self, tab):
+        # Exclusive use of the driver, switched to tab. If the page work opened
+        # a new tab for this job (course or practice link), the job moves there
+        # and its old tab is closed.
+        started = time.perf_counter()
+        with self.lock:
+            self.waited += time.perf_counter() - started
+            driver = browser.driver
+            if self.current != tab.handle:
+                driver.switch_to.window(tab.handle)
+                self.current = tab.handle
+            try:
+                yield tab
+            finally:
+                self._follow_new_tab(tab)
+
+    def _follow_new_tab(self, tab):
+        # Called inside a turn; never masks the turn's own error
+        driver = browser.driver
+        try:
+            handle = driver.current_window_handle
+            if handle != tab.handle:
+                logging.info(f"Pool tab {tab.index} moved to a newly opened tab")
+                driver.switch_to.window(tab.handle)
+                driver.close()
+                driver.switch_to.window(handle)
+                tab.handle = handle
+            self.current = handle
+        except Exception as e:
+            logging.warning(f"Could not check pool tab {tab.index}: {e}")
+            self.current = None
+
+    def run(self, jobs, args):
+        # jobs: [(subject_id, week)]; returns one result per job in job order
+        pending = queue.Queue()
+        for position, job in enumerate(jobs):
+            pending.put((position, job))
+        results = [None] * len(jobs)
+
+        def work(tab):
+            while True:
+                try:
+                    position, (subject_id, week) = pending.get_nowait()
+                except queue.Empty:
+                    return
+                print(f"\n📅 Week {week} on tab {tab.index}")
+                with span("week", week=week, tab=tab.index) as week_span:
+                    try:
+                        browser.run_job(subject_id, week, args, turn=lambda: self.turn(tab))
+                    except Exception as e:
+                        logging.exception(f"Week {week} failed on tab {tab.index}")
+                        print(f"❌ Week {week} failed: {e}")
+                        week_span.outcome = "error"
+                        week_span.set(error=str(e)[:300])
+                results[position] = {"week": week, "tab": tab.index, "outcome": week_span.outcome,
+                                     "seconds": round(week_span.duration, 3), "error": week_span.attrs.get("error")}
+
+        workers = [threading.Thread(target=work, args=(tab,), name=f"tab-{tab.index}", daemon=True)
+                   for tab in self.tabs]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return [result for result in results if result]
+
+
+def run_pool(subject_id, weeks, args, tabs=DEFAULT_TABS, profiler=None):
+    # Like browser.run_batch, but up to `tabs` weeks are in flight at once
+    report = run_report.start_run(subject=subject_id, weeks=",".join(map(str, weeks)),
+                                  backend=args.backend, mode="tab-pool", tabs=tabs)
+    attached = False
+    pool = TabPool(min(tabs, len(weeks)))
+    started = time.perf_counter()
+    try:
+        attached = browser.open_session(args)
+        pool.open()
+        results = pool.run([(subject_id, week) for week in weeks], args)
+        elapsed = time.perf_counter() - started
+        report.extra["weeks"] = results
+        report.extra["tab_pool"] = {"tabs": len(pool.tabs), "seconds": round(elapsed, 3),
+                                    "turn_wait_seconds": round(pool.waited, 3)}
+        print("\n📊 Tab pool summary:")
+        for result in results:
+            print(f"   Week {result['week']:<4}tab {result['tab']:<3}{result['outcome']:<8}{result['seconds']:>9.2f}s")
+        busy = sum(result["seconds"] for result in results)
+        print(f"   {len(results)} weeks in {elapsed:.2f}s on {len(pool.tabs)} tabs "
+              f"({busy / elapsed if elapsed else 0:.1f}x overlap)")
+    finally:
+        if pool.tabs and browser.session_alive():
+            pool.close()
+        browser.finish_report(report, args)
+        if profiler:
+            profiler.stop()
+        browser.release_session(attached)
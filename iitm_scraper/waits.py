@@ -0,0 +1,132 @@
+import os
+import time
+import json
+import logging
+from selenium.common.exceptions import WebDriverException
+
+# --- Event-driven waits ---
+# Replaces fixed time.sleep() calls with waits on real page conditions:
+# DOM mutation quiescence (MutationObserver), element stability (bounding
+# box unchanged across polls) and network idle (in-flight fetch/XHR count).
+# Every wait is capped by a configurable upper bound and its actual duration
+# is recorded so timeouts can be tuned from data.
+
+DEFAULT_MAX_WAIT = float(os.getenv("WAIT_MAX_SECONDS", "10"))
+DEFAULT_QUIET_MS = int(os.getenv("WAIT_QUIET_MS", "300"))
+
+SETTLE_JS = """
+var el = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+var checkDom = arguments[3], checkNetwork = arguments[4];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+
+if (checkNetwork && !window.__aasNet) {
+    var net = window.__aasNet = {pending: 0, lastActivity: performance.now()};
+    var begin = function () { net.pending++; net.lastActivity = performance.now(); };
+    var end = function () { net.pending = Math.max(0, net.pending - 1); net.lastActivity = performance.now(); };
+    if (window.fetch) {
+        var origFetch = window.fetch;
+        window.fetch = function () { begin(); return origFetch.apply(this, arguments).finally(end); };
+    }
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener('loadend', end);
+        return origSend.apply(this, arguments);
+    };
+}
+
+var lastMutation = performance.now();
+var observer = null;
+if (checkDom) {
+    observer = new MutationObserver(function () { lastMutation = performance.now(); });
+    observer.observe(document.documentElement,
+                     {childList: true, subtree: true, attributes: true, characterData: true});
+}
+
+var lastRect = null, stablePolls = 0;
+function tick() {
+    var now = performance.now();
+    var domQuiet = !checkDom || now - lastMutation >= quietMs;
+    var stable = true;
+    if (el) {
+        try {
+            var r = el.getBoundingClientRect();
+            var key = [r.top, r.left, r.width, r.height].join(',');
+            stablePolls = key === lastRect ? stablePolls + 1 : 0;
+            lastRect = key;
+            stable = stablePolls >= 2;
+        } catch (e) {
+            stable = true;
+        }
+    }
+    var netIdle = !checkNetwork || (window.__aasNet.pending === 0 &&
+                                    now - window.__aasNet.lastActivity >= quietMs);
+    var settled = domQuiet && stable && netIdle;
+    if (settled || now - start >= timeoutMs) {
+        if (observer) observer.disconnect();
+        done({settled: settled, dom_quiet: domQuiet, stable: stable, network_idle: netIdle});
+        return;
+    }
+    setTimeout(tick, 50);
+}
+setTimeout(tick, 50);
+"""
+
+
+class WaitEngine:
+    def __init__(self, driver, max_wait=DEFAULT_MAX_WAIT, quiet_ms=DEFAULT_QUIET_MS):
+        self.driver = driver
+        self.max_wait = max_wait
+        self.quiet_ms = quiet_ms
+        self.timings = []
+        # Leave headroom so the in-page deadline always fires before Selenium's
+        driver.set_script_timeout(max_wait + 5)
+
+    def settle(self, label, element=None, dom=True, network=False, max_wait=None):
+        timeout = self.max_wait if max_wait is None else min(max_wait, self.max_wait)
+        start = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(
+                SETTLE_JS, element, self.quiet_ms, int(timeout * 1000), dom, network
+            ) or {}
+        except WebDriverException as e:
+            logging.warning(f"Wait '{label}' failed: {e}")
+            result = {"settled": False, "error": str(e)}
+        elapsed = time.perf_counter() - start
+        settled = bool(result.get("settled"))
+        self.timings.append({"label": label, "seconds": round(elapsed, 3), "settled": settled})
+        logging.debug("Wait '%s' took %.3fs (settled=%s, result=%s)", label, elapsed, settled, result)
+        return settled
+
+    def dom_quiet(self, label, max_wait=None):
+        return self.settle(label, max_wait=max_wait)
+
+    def element_stable(self, element, label, max_wait=None):
+        return self.settle(label, element=element, dom=False, max_wait=max_wait)
+
+    def network_idle(self, label, max_wait=None):
+        return self.settle(label, dom=False, network=True, max_wait=max_wait)
+
+    def summary(self):
+        stats = {}
+        for record in self.timings:
+            entry = stats.setdefault(record["label"], {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["total"] += record["seconds"]
+            entry["max"] = max(entry["max"], record["seconds"])
+            if not record["settled"]:
+                entry["timeouts"] += 1
+        for entry in stats.values():
+            entry["total"] = round(entry["total"], 3)
+            entry["mean"] = round(entry["total"] / entry["count"], 3)
+        return stats
+
+    def save_report(self, path="wait_timings.json"):
+        stats = self.summary()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"max_wait": self.max_wait, "quiet_ms": self.quiet_ms,
+                       "summary": stats, "waits": self.timings}, f, indent=2)
+        total = sum(entry["total"] for entry in stats.values())
+        logging.info(f"Spent {total:.2f}s in {len(self.timings)} waits; timings saved to {path}")
+        return stats